@@ -106,8 +106,8 @@ async def main():
         return Response(status=HTTPStatus.CREATED)
     
     # Check route metadata
-    print(f"get_items route: {get_items._route.method} {get_items._route.path}")
-    print(f"create_item route: {create_item._route.method} {create_item._route.path}")
+    print(f"get_items route: {' '.join(get_items._route_spec)}")
+    print(f"create_item route: {' '.join(create_item._route_spec)}")
     print()
 
     # Example 4: Request with data
@@ -16,6 +16,7 @@ from dev.engineeringlabs.pyboot.fileio.api import (
 from dev.engineeringlabs.pyboot.fileio.core import (
     read_file,
     write_file,
+    write_files_batch,
     read_json,
     write_json,
     read_yaml,
@@ -32,6 +33,7 @@ __all__ = [
     # Core
     "read_file",
     "write_file",
+    "write_files_batch",
     "read_json",
     "write_json",
     "read_yaml",
@@ -1,60 +1,238 @@
 """FileIO Core - File I/O implementations."""
 
 import json
+import math
+import mmap
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 from dev.engineeringlabs.pyboot.fileio.api import FileError
 
+# Try to use orjson for performance, fall back to standard json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with them
+try:
+    import yaml
+    HAS_YAML = True
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+except ImportError:
+    HAS_YAML = False
+
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_READ_CHUNK = 1 << 20
+# JSON files at least this large are parsed straight from a memory map
+_MMAP_THRESHOLD = 1 << 16
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """Read the rest of an open file, in one read() call when size is right."""
+    # Asking for one byte more than st_size detects EOF without a second
+    # call when exactly st_size bytes come back. read() may return fewer
+    # bytes than asked without being at EOF (large files, pipes, network
+    # filesystems), and files may grow, so otherwise read on until EOF
+    data = os.read(fd, size + 1)
+    if len(data) == size or not data:
+        return data
+    chunks = [data]
+    while chunk := os.read(fd, _READ_CHUNK):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a whole file."""
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        return _read_fd(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
 
 def read_file(path: str | Path) -> str:
-    """Read file contents as string."""
+    """Read file contents as string.
+    
+    Line endings are normalized to "\n", as in text-mode reads.
+    """
+    path = os.fspath(path)
     try:
-        return Path(path).read_text(encoding="utf-8")
+        content = _read_bytes(path).decode("utf-8")
     except OSError as e:
-        raise FileError(f"Failed to read file: {e}", str(path), cause=e)
+        raise FileError(f"Failed to read file: {e}", path, cause=e)
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Replace a file's contents with one write() call where possible."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        written = os.write(fd, data)
+        if written < len(data):
+            view = memoryview(data)[written:]
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def write_file(path: str | Path, content: str) -> None:
-    """Write string to file."""
+    """Write string to file.
+    
+    Content is encoded up front and written unbuffered, without newline
+    translation.
+    """
+    path = os.fspath(path)
     try:
-        Path(path).write_text(content, encoding="utf-8")
+        _write_bytes(path, content.encode("utf-8"))
     except OSError as e:
-        raise FileError(f"Failed to write file: {e}", str(path), cause=e)
+        raise FileError(f"Failed to write file: {e}", path, cause=e)
+
+
+def write_files_batch(files: Iterable[tuple[str | Path, str]]) -> None:
+    """Write several (path, content) pairs, stopping at the first failure."""
+    for path, content in files:
+        write_file(path, content)
 
 
 def read_json(path: str | Path) -> Any:
-    """Read JSON file."""
+    """Read JSON file.
+    
+    With orjson, large files are parsed directly from a read-only memory
+    map instead of being copied into a bytes object first.
+    """
+    path = os.fspath(path)
+    try:
+        fd = os.open(path, _READ_FLAGS)
+        try:
+            size = os.fstat(fd).st_size
+            if HAS_ORJSON and size >= _MMAP_THRESHOLD:
+                return _load_json_mapped(fd, path)
+            data = _read_fd(fd, size)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        raise FileError(f"Failed to read file: {e}", path, cause=e)
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return _json_loads(data, path)
+
+
+def _load_json_mapped(fd: int, path: str) -> Any:
+    """Parse JSON from a memory map of an open file with orjson."""
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass
+        data = mapped[:]
+    return _json_loads(data, path)
+
+
+def _json_loads(data: bytes, path: str) -> Any:
+    """Parse JSON with the json module.
+    
+    Also the fallback for input json accepts but orjson does not
+    (NaN/Infinity, integers beyond 64 bits, a UTF-8 BOM).
+    """
     try:
-        content = read_file(path)
-        return json.loads(content)
-    except json.JSONDecodeError as e:
-        raise FileError(f"Invalid JSON: {e}", str(path), cause=e)
+        return json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise FileError(f"Invalid JSON: {e}", path, cause=e)
 
 
-def write_json(path: str | Path, data: Any, indent: int = 2) -> None:
-    """Write data as JSON file."""
+def _is_plain_json(data: Any) -> bool:
+    """Check data only holds types orjson encodes to the same values as json.
+    
+    That is str-keyed dicts, lists, tuples, str, int, bool, None and finite
+    floats (exact types). orjson writes NaN/Infinity as null and natively
+    encodes types json rejects (datetime, UUID, Enum, dataclasses), so
+    anything else must go through json. A container seen twice also fails
+    the check, so json reports circular references instead of this loop
+    running forever.
+    """
+    stack = [data]
+    pop = stack.pop
+    push = stack.extend
+    seen: set[int] = set()
+    while stack:
+        value = pop()
+        kind = type(value)
+        if kind is str or kind is int or kind is bool or value is None:
+            continue
+        if kind is float:
+            if not math.isfinite(value):
+                return False
+            continue
+        if kind is not dict and kind is not list and kind is not tuple:
+            return False
+        container_id = id(value)
+        if container_id in seen:
+            return False
+        seen.add(container_id)
+        if kind is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            push(value.values())
+        else:
+            push(value)
+    return True
+
+
+def write_json(path: str | Path, data: Any, indent: int | None = 2) -> None:
+    """Write data as JSON file.
+    
+    Uses orjson when available, ``indent`` is 2 or None and the data is
+    plain JSON (see _is_plain_json); everything else goes through the json
+    module, so the written values never depend on whether orjson is
+    installed.
+    """
+    path = os.fspath(path)
+    if HAS_ORJSON and indent in (2, None) and _is_plain_json(data):
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits or lone surrogates; let json handle them
+            pass
+        else:
+            try:
+                _write_bytes(path, payload)
+            except OSError as e:
+                raise FileError(f"Failed to write file: {e}", path, cause=e)
+            return
     content = json.dumps(data, indent=indent)
     write_file(path, content)
 
 
 def read_yaml(path: str | Path) -> Any:
     """Read YAML file (requires pyyaml)."""
-    try:
-        import yaml
-        content = read_file(path)
-        return yaml.safe_load(content)
-    except ImportError:
+    if not HAS_YAML:
         raise FileError("YAML support requires 'pyyaml' library", str(path))
+    content = read_file(path)
+    return yaml.load(content, Loader=_YamlLoader)
 
 
 def write_yaml(path: str | Path, data: Any) -> None:
     """Write data as YAML file (requires pyyaml)."""
-    try:
-        import yaml
-        content = yaml.safe_dump(data, default_flow_style=False)
-        write_file(path, content)
-    except ImportError:
+    if not HAS_YAML:
         raise FileError("YAML support requires 'pyyaml' library", str(path))
+    content = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False)
+    write_file(path, content)
 
 
 def ensure_dir(path: str | Path) -> Path:
@@ -83,6 +261,7 @@ class FileWatcher:
 __all__ = [
     "read_file",
     "write_file",
+    "write_files_batch",
     "read_json",
     "write_json",
     "read_yaml",
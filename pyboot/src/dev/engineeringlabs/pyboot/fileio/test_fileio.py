@@ -1,11 +1,12 @@
 """Tests for fileio module."""
 
+import os
 import pytest
-import tempfile
 from pathlib import Path
 from dev.engineeringlabs.pyboot.fileio import (
     read_file,
     write_file,
+    write_files_batch,
     read_json,
     write_json,
     ensure_dir,
@@ -13,21 +14,12 @@ from dev.engineeringlabs.pyboot.fileio import (
 )
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory."""
-    import shutil
-    path = Path(tempfile.mkdtemp())
-    yield path
-    shutil.rmtree(path)
-
-
 class TestReadWriteFile:
     """Tests for read_file and write_file."""
     
-    def test_write_and_read(self, temp_dir):
+    def test_write_and_read(self, tmp_path):
         """Test writing and reading a file."""
-        path = temp_dir / "test.txt"
+        path = tmp_path / "test.txt"
         content = "Hello, World!"
         
         write_file(path, content)
@@ -35,9 +27,9 @@ class TestReadWriteFile:
         
         assert result == content
     
-    def test_read_unicode(self, temp_dir):
+    def test_read_unicode(self, tmp_path):
         """Test reading unicode content."""
-        path = temp_dir / "unicode.txt"
+        path = tmp_path / "unicode.txt"
         content = "Hello, 世界! 🎉"
         
         write_file(path, content)
@@ -45,16 +37,49 @@ class TestReadWriteFile:
         
         assert result == content
     
-    def test_read_nonexistent_raises(self, temp_dir):
+    def test_read_normalizes_newlines(self, tmp_path):
+        """Test CRLF and CR line endings read as LF."""
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"one\r\ntwo\rthree\n")
+        
+        assert read_file(path) == "one\ntwo\nthree\n"
+    
+    def test_read_empty_and_large(self, tmp_path):
+        """Test reading empty and multi-chunk files."""
+        empty = tmp_path / "empty.txt"
+        large = tmp_path / "large.txt"
+        content = "x" * (3 << 20)
+        
+        write_file(empty, "")
+        write_file(large, content)
+        
+        assert read_file(empty) == ""
+        assert read_file(large) == content
+    
+    def test_read_short_reads(self, tmp_path, monkeypatch):
+        """Test reads that return fewer bytes than asked are continued."""
+        text_path = tmp_path / "short.txt"
+        json_path = tmp_path / "short.json"
+        content = "".join(chr(ord("a") + i % 26) for i in range(100_000))
+        write_file(text_path, content)
+        write_json(json_path, {"items": list(range(1000))})
+        
+        real_read = os.read
+        monkeypatch.setattr(os, "read", lambda fd, n: real_read(fd, min(n, 4096)))
+        
+        assert read_file(text_path) == content
+        assert read_json(json_path) == {"items": list(range(1000))}
+    
+    def test_read_nonexistent_raises(self, tmp_path):
         """Test reading nonexistent file raises."""
-        path = temp_dir / "nonexistent.txt"
+        path = tmp_path / "nonexistent.txt"
         
         with pytest.raises(FileError):
             read_file(path)
     
-    def test_write_multiline(self, temp_dir):
+    def test_write_multiline(self, tmp_path):
         """Test writing multiline content."""
-        path = temp_dir / "lines.txt"
+        path = tmp_path / "lines.txt"
         content = "Line 1\nLine 2\nLine 3"
         
         write_file(path, content)
@@ -62,14 +87,36 @@ class TestReadWriteFile:
         
         assert result == content
         assert len(result.split("\n")) == 3
+    
+    def test_overwrite_truncates(self, tmp_path):
+        """Test writing shorter content replaces the file."""
+        path = tmp_path / "over.txt"
+        
+        write_file(path, "a much longer first version")
+        write_file(path, "short")
+        
+        assert read_file(path) == "short"
+    
+    def test_write_files_batch(self, tmp_path):
+        """Test writing several files at once."""
+        files = [(tmp_path / f"f{i}.txt", f"content {i}") for i in range(3)]
+        
+        write_files_batch(files)
+        
+        assert [read_file(path) for path, _ in files] == ["content 0", "content 1", "content 2"]
+    
+    def test_write_missing_dir_raises(self, tmp_path):
+        """Test writing into a missing directory raises."""
+        with pytest.raises(FileError):
+            write_file(tmp_path / "missing" / "x.txt", "data")
 
 
 class TestReadWriteJson:
     """Tests for read_json and write_json."""
     
-    def test_write_and_read_json(self, temp_dir):
+    def test_write_and_read_json(self, tmp_path):
         """Test writing and reading JSON."""
-        path = temp_dir / "data.json"
+        path = tmp_path / "data.json"
         data = {"name": "test", "value": 42}
         
         write_json(path, data)
@@ -77,9 +124,9 @@ class TestReadWriteJson:
         
         assert result == data
     
-    def test_json_with_list(self, temp_dir):
+    def test_json_with_list(self, tmp_path):
         """Test JSON with list."""
-        path = temp_dir / "list.json"
+        path = tmp_path / "list.json"
         data = [1, 2, 3, "four", 5.0]
         
         write_json(path, data)
@@ -87,9 +134,9 @@ class TestReadWriteJson:
         
         assert result == data
     
-    def test_json_nested(self, temp_dir):
+    def test_json_nested(self, tmp_path):
         """Test nested JSON."""
-        path = temp_dir / "nested.json"
+        path = tmp_path / "nested.json"
         data = {
             "config": {
                 "server": {"host": "localhost", "port": 8080},
@@ -102,47 +149,123 @@ class TestReadWriteJson:
         
         assert result["config"]["server"]["port"] == 8080
     
-    def test_read_invalid_json_raises(self, temp_dir):
+    def test_json_unicode_and_int_keys(self, tmp_path):
+        """Test non-ASCII text and non-string keys round-trip."""
+        path = tmp_path / "keys.json"
+        
+        write_json(path, {"name": "世界", 1: "one"})
+        
+        assert read_json(path) == {"name": "世界", "1": "one"}
+    
+    def test_json_outside_orjson_range(self, tmp_path):
+        """Test big integers and custom indents are still written."""
+        path = tmp_path / "big.json"
+        
+        write_json(path, {"big": 2 ** 70}, indent=4)
+        
+        assert read_json(path) == {"big": 2 ** 70}
+        assert '\n    "big"' in read_file(path)
+    
+    def test_json_non_finite_floats(self, tmp_path):
+        """Test NaN and infinities round-trip instead of becoming null."""
+        path = tmp_path / "nan.json"
+        
+        write_json(path, {"x": float("nan"), "y": [float("inf"), -float("inf")], "z": None})
+        result = read_json(path)
+        
+        assert result["x"] != result["x"]
+        assert result["y"] == [float("inf"), -float("inf")]
+        assert result["z"] is None
+    
+    def test_json_rejects_unsupported_types(self, tmp_path):
+        """Test types json cannot encode raise regardless of orjson."""
+        import datetime
+        import uuid
+        
+        for value in [datetime.date(2024, 1, 1), uuid.uuid4(), {1, 2}]:
+            with pytest.raises(TypeError):
+                write_json(tmp_path / "bad.json", {"value": value})
+    
+    def test_json_circular_reference(self, tmp_path):
+        """Test self-referencing data raises instead of hanging."""
+        data: dict = {}
+        data["self"] = data
+        with pytest.raises(ValueError, match="Circular reference"):
+            write_json(tmp_path / "cyclic.json", data)
+        
+        items: list = []
+        items.append(items)
+        with pytest.raises(ValueError, match="Circular reference"):
+            write_json(tmp_path / "cyclic.json", {"items": items})
+    
+    def test_json_shared_values(self, tmp_path):
+        """Test a value referenced twice is written twice, not as a cycle."""
+        path = tmp_path / "shared.json"
+        shared = [1, 2]
+        write_json(path, {"a": shared, "b": shared})
+        assert read_json(path) == {"a": [1, 2], "b": [1, 2]}
+    
+    def test_large_json(self, tmp_path):
+        """Test reading JSON files large enough to be memory-mapped."""
+        path = tmp_path / "large.json"
+        data = {"items": [{"id": i, "name": f"item {i}"} for i in range(5000)]}
+        
+        write_json(path, data)
+        assert read_json(path) == data
+        
+        write_file(path, '{"nan": NaN, "pad": "' + "x" * (1 << 17) + '"}')
+        assert read_json(path)["pad"] == "x" * (1 << 17)
+        
+        write_file(path, '{"broken": ' + " " * (1 << 17))
+        with pytest.raises(FileError):
+            read_json(path)
+    
+    def test_read_invalid_json_raises(self, tmp_path):
         """Test reading invalid JSON raises."""
-        path = temp_dir / "invalid.json"
+        path = tmp_path / "invalid.json"
         write_file(path, "not valid json")
         
         with pytest.raises(FileError):
             read_json(path)
+    
+    def test_read_missing_json_raises(self, tmp_path):
+        """Test reading a missing JSON file raises."""
+        with pytest.raises(FileError):
+            read_json(tmp_path / "missing.json")
 
 
 class TestEnsureDir:
     """Tests for ensure_dir."""
     
-    def test_creates_directory(self, temp_dir):
+    def test_creates_directory(self, tmp_path):
         """Test creating a directory."""
-        path = temp_dir / "new_dir"
+        path = tmp_path / "new_dir"
         
         result = ensure_dir(path)
         
         assert result.exists()
         assert result.is_dir()
     
-    def test_creates_nested_directories(self, temp_dir):
+    def test_creates_nested_directories(self, tmp_path):
         """Test creating nested directories."""
-        path = temp_dir / "a" / "b" / "c" / "d"
+        path = tmp_path / "a" / "b" / "c" / "d"
         
         result = ensure_dir(path)
         
         assert result.exists()
     
-    def test_existing_directory(self, temp_dir):
+    def test_existing_directory(self, tmp_path):
         """Test with existing directory."""
-        path = temp_dir / "existing"
+        path = tmp_path / "existing"
         path.mkdir()
         
         result = ensure_dir(path)
         
         assert result.exists()
     
-    def test_returns_path(self, temp_dir):
+    def test_returns_path(self, tmp_path):
         """Test returns Path object."""
-        path = temp_dir / "test"
+        path = tmp_path / "test"
         
         result = ensure_dir(path)
         
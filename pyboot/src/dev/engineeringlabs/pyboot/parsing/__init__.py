@@ -17,6 +17,7 @@ from dev.engineeringlabs.pyboot.parsing.core import (
     parse_json,
     parse_yaml,
     parse_toml,
+    parse_toml_many,
     Parser,
     JsonParser,
     YamlParser,
@@ -31,6 +32,7 @@ __all__ = [
     "parse_json",
     "parse_yaml",
     "parse_toml",
+    "parse_toml_many",
     "Parser",
     "JsonParser",
     "YamlParser",
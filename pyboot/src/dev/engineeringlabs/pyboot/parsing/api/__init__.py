@@ -7,7 +7,13 @@ T = TypeVar("T")
 
 
 class ParseError(Exception):
-    """Base error for parsing operations."""
+    """Base error for parsing operations.
+    
+    ``incomplete`` is set when the content ended before the document did,
+    so callers accumulating streamed chunks can wait for more input.
+    """
+    
+    __slots__ = ("message", "line", "column", "cause", "incomplete")
     
     def __init__(
         self,
@@ -16,12 +22,14 @@ class ParseError(Exception):
         line: int | None = None,
         column: int | None = None,
         cause: Exception | None = None,
+        incomplete: bool = False,
     ) -> None:
         super().__init__(message)
         self.message = message
         self.line = line
         self.column = column
         self.cause = cause
+        self.incomplete = incomplete
 
 
 class ParseResult(Generic[T]):
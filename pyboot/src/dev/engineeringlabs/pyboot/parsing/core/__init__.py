@@ -1,9 +1,24 @@
 """Parsing Core - Parser implementations."""
 
 import json
-from typing import Any, Protocol
+from typing import Any, Iterable, Protocol
 from dev.engineeringlabs.pyboot.parsing.api import ParseError, ParseResult
 
+# Try to use orjson for performance, fall back to standard json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    import yaml
+    HAS_YAML = True
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    HAS_YAML = False
+
 
 class Parser(Protocol):
     """Parser protocol."""
@@ -13,20 +28,57 @@ class Parser(Protocol):
         ...
 
 
+# Characters a complete JSON document can end with: closing brackets and
+# quotes, digits, and the last letters of true/false, null, NaN, Infinity
+_JSON_END_CHARS = frozenset('}]"0123456789elNy')
+_JSON_WHITESPACE = frozenset(" \t\n\r")
+
+
+def _may_end_document(content: str) -> bool:
+    """Check the last non-whitespace character can end a JSON document.
+    
+    Scans back from the end instead of stripping, so large payloads are
+    not copied.
+    """
+    end = len(content)
+    while end and content[end - 1] in _JSON_WHITESPACE:
+        end -= 1
+    return end > 0 and content[end - 1] in _JSON_END_CHARS
+
+
 class JsonParser:
-    """JSON parser."""
+    """JSON parser (uses orjson when available)."""
     
-    def parse(self, content: str) -> ParseResult[Any]:
-        """Parse JSON content."""
+    def parse(self, content: str | bytes) -> ParseResult[Any]:
+        """Parse JSON content.
+        
+        String content that cannot end a complete document (empty, or
+        ending mid-value) skips orjson, which could only fail on it, and
+        goes straight to json for the error. Errors keep the decoder's
+        message and position and are marked ``incomplete`` when the
+        decoder ran out of input.
+        """
+        if HAS_ORJSON and (not isinstance(content, str) or _may_end_document(content)):
+            try:
+                return ParseResult(value=orjson.loads(content))
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json (no NaN/Infinity, 64-bit
+                # integers), so fall through for the result or the error
+                pass
         try:
             return ParseResult(value=json.loads(content))
         except json.JSONDecodeError as e:
-            return ParseResult(error=ParseError(
+            error = ParseError(
                 f"Invalid JSON: {e.msg}",
                 line=e.lineno,
                 column=e.colno,
                 cause=e,
-            ))
+                # An unterminated string runs to the end of input but is
+                # reported at its opening quote
+                incomplete=e.pos >= len(e.doc) or e.msg.startswith("Unterminated string"),
+            )
+            error.__cause__ = e
+            return ParseResult(error=error)
 
 
 class YamlParser:
@@ -34,11 +86,10 @@ class YamlParser:
     
     def parse(self, content: str) -> ParseResult[Any]:
         """Parse YAML content."""
-        try:
-            import yaml
-            return ParseResult(value=yaml.safe_load(content))
-        except ImportError:
+        if not HAS_YAML:
             return ParseResult(error=ParseError("YAML support requires 'pyyaml' library"))
+        try:
+            return ParseResult(value=yaml.load(content, Loader=_YamlLoader))
         except Exception as e:
             return ParseResult(error=ParseError(f"Invalid YAML: {e}", cause=e))
 
@@ -57,24 +108,46 @@ class TomlParser:
             return ParseResult(error=ParseError(f"Invalid TOML: {e}", cause=e))
 
 
-def parse_json(content: str) -> Any:
+# Parsers are stateless, so the convenience functions share one of each
+_json_parser = JsonParser()
+_yaml_parser = YamlParser()
+_toml_parser = TomlParser()
+
+
+def parse_json(content: str | bytes) -> Any:
     """Parse JSON content (raises on error)."""
-    result = JsonParser().parse(content)
+    result = _json_parser.parse(content)
     return result.unwrap()
 
 
 def parse_yaml(content: str) -> Any:
     """Parse YAML content (raises on error)."""
-    result = YamlParser().parse(content)
+    result = _yaml_parser.parse(content)
     return result.unwrap()
 
 
 def parse_toml(content: str) -> Any:
     """Parse TOML content (raises on error)."""
-    result = TomlParser().parse(content)
+    result = _toml_parser.parse(content)
     return result.unwrap()
 
 
+def parse_toml_many(fragments: Iterable[str]) -> list[Any]:
+    """Parse several independent TOML documents (raises on first error).
+    
+    The error message is prefixed with the index of the failing fragment.
+    """
+    values = []
+    parse = _toml_parser.parse
+    for index, content in enumerate(fragments):
+        result = parse(content)
+        if result.is_err:
+            error = result.unwrap_err()
+            raise ParseError(f"Fragment {index}: {error.message}", cause=error.cause)
+        values.append(result.unwrap())
+    return values
+
+
 __all__ = [
     "Parser",
     "JsonParser",
@@ -83,4 +156,5 @@ __all__ = [
     "parse_json",
     "parse_yaml",
     "parse_toml",
+    "parse_toml_many",
 ]
@@ -5,6 +5,7 @@ from dev.engineeringlabs.pyboot.parsing import (
     parse_json,
     parse_yaml,
     parse_toml,
+    parse_toml_many,
     ParseError,
     ParseResult,
     JsonParser,
@@ -40,6 +41,19 @@ class TestParseJson:
         assert result["bool"] is True
         assert result["null"] is None
     
+    def test_parse_beyond_orjson(self):
+        """Test values outside orjson's range still parse."""
+        result = parse_json('{"big": 123456789012345678901234567890, "nan": NaN}')
+        assert result["big"] == 123456789012345678901234567890
+        assert result["nan"] != result["nan"]
+    
+    def test_parse_bytes(self):
+        """Test parsing JSON given as bytes."""
+        assert parse_json(b'{"a": 1}') == {"a": 1}
+        assert parse_json(b'[1, 2]\n') == [1, 2]
+        with pytest.raises(ParseError):
+            parse_json(b'{"a": ')
+    
     def test_parse_invalid_raises(self):
         """Test invalid JSON raises ParseError."""
         with pytest.raises(ParseError):
@@ -73,6 +87,35 @@ class TestJsonParser:
         
         error = result.unwrap_err()
         assert error.line is not None
+    
+    def test_incomplete_input(self):
+        """Test only documents the decoder ran out of input on are flagged incomplete."""
+        parser = JsonParser()
+        
+        for content in ['', '  ', '{"key": "va', '[1, 2,', '{"a": 1', '{"a":\n']:
+            error = parser.parse(content).unwrap_err()
+            assert error.incomplete, content
+        
+        for content in ['{"key": invalid}', 'hello', '[1, 2]]', '{"a" 1}']:
+            error = parser.parse(content).unwrap_err()
+            assert not error.incomplete, content
+        
+        for content in ['{}', '[]', '"s"', '12', 'true', 'false', 'null', '{"a": 1}\n']:
+            assert parser.parse(content).is_ok
+    
+    def test_error_keeps_decoder_details(self):
+        """Test errors carry the decoder's message, position and cause."""
+        import json
+        
+        error = JsonParser().parse('{"a": 1,\n "b": tru').unwrap_err()
+        
+        assert error.message == "Invalid JSON: Expecting value"
+        assert (error.line, error.column) == (2, 7)
+        assert isinstance(error.__cause__, json.JSONDecodeError)
+        assert error.cause is error.__cause__
+        with pytest.raises(ParseError) as exc_info:
+            parse_json('[1, 2')
+        assert isinstance(exc_info.value.__cause__, json.JSONDecodeError)
 
 
 class TestParseResult:
@@ -127,6 +170,16 @@ class TestParseToml:
         """Test parsing TOML array."""
         result = parse_toml('items = [1, 2, 3]')
         assert result["items"] == [1, 2, 3]
+    
+    def test_parse_many(self):
+        """Test parsing several TOML fragments."""
+        result = parse_toml_many(['a = 1', '[section]\nkey = "value"', '[[items]]\nid = 1'])
+        assert result == [{"a": 1}, {"section": {"key": "value"}}, {"items": [{"id": 1}]}]
+    
+    def test_parse_many_reports_fragment(self):
+        """Test errors name the failing fragment."""
+        with pytest.raises(ParseError, match="Fragment 1"):
+            parse_toml_many(['a = 1', 'a = ', 'b = 2'])
 
 
 class TestParseYaml:
@@ -12,9 +12,9 @@ class RateLimitStrategy(Enum):
     SLIDING_WINDOW = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig:
-    """Rate limit configuration."""
+    """Rate limit configuration (immutable; limiters read it once)."""
     strategy: RateLimitStrategy = RateLimitStrategy.TOKEN_BUCKET
     max_requests: int = 100
     window_seconds: float = 60.0
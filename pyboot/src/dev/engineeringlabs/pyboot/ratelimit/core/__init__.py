@@ -3,6 +3,7 @@
 import time
 import functools
 import asyncio
+from array import array
 from typing import Callable, TypeVar, Any, Awaitable
 from dev.engineeringlabs.pyboot.ratelimit.api import (
     RateLimitConfig,
@@ -32,31 +33,34 @@ class RateLimiter:
 
 
 class TokenBucket(RateLimiter):
-    """Token bucket rate limiter."""
+    """Token bucket rate limiter.
+    
+    Tokens are kept as exact integers scaled by the window length in
+    nanoseconds, so one token is ``window_ns`` units and every elapsed
+    nanosecond refills ``max_requests`` units.
+    """
     
     def __init__(self, config: RateLimitConfig) -> None:
         super().__init__(config)
-        self._tokens = float(config.max_requests)
-        self._last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._refill = config.max_requests
+        self._one = max(1, round(config.window_seconds * 1_000_000_000))
+        self._capacity = config.max_requests * self._one
+        self._tokens = self._capacity
+        self._last_update = time.monotonic_ns()
     
     async def acquire(self) -> bool:
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self._last_update
-            self._last_update = now
-            
-            # Add tokens based on elapsed time
-            rate = self.config.max_requests / self.config.window_seconds
-            self._tokens = min(
-                self.config.max_requests,
-                self._tokens + (elapsed * rate),
-            )
-            
-            if self._tokens >= 1:
-                self._tokens -= 1
-                return True
-            return False
+        # No awaits below, so the update is atomic within the event loop
+        now = time.monotonic_ns()
+        tokens = self._tokens + (now - self._last_update) * self._refill
+        self._last_update = now
+        if tokens > self._capacity:
+            tokens = self._capacity
+        
+        if tokens >= self._one:
+            self._tokens = tokens - self._one
+            return True
+        self._tokens = tokens
+        return False
 
 
 class LeakyBucket(RateLimiter):
@@ -64,67 +68,116 @@ class LeakyBucket(RateLimiter):
     
     def __init__(self, config: RateLimitConfig) -> None:
         super().__init__(config)
+        self._max_requests = config.max_requests
+        self._window = config.window_seconds
         self._queue: list[float] = []
-        self._lock = asyncio.Lock()
     
     async def acquire(self) -> bool:
-        async with self._lock:
-            now = time.monotonic()
-            interval = self.config.window_seconds / self.config.max_requests
-            
-            # Remove old entries
-            self._queue = [t for t in self._queue if now - t < self.config.window_seconds]
-            
-            if len(self._queue) < self.config.max_requests:
-                self._queue.append(now)
-                return True
-            return False
+        # No awaits below, so the update is atomic within the event loop
+        now = time.monotonic()
+        window = self._window
+        
+        # Remove old entries
+        self._queue = [t for t in self._queue if now - t < window]
+        
+        if len(self._queue) < self._max_requests:
+            self._queue.append(now)
+            return True
+        return False
+
+
+# FixedWindow packs (window start ns, count) into one int; the count field
+# is wide enough that it can never carry into the start
+_COUNT_BITS = 64
+_COUNT_MASK = (1 << _COUNT_BITS) - 1
 
 
 class FixedWindow(RateLimiter):
-    """Fixed window rate limiter."""
+    """Fixed window rate limiter.
+    
+    The window start (monotonic ns) and the count live in one packed int,
+    so each acquire reads and writes a single attribute.
+    """
     
     def __init__(self, config: RateLimitConfig) -> None:
         super().__init__(config)
-        self._count = 0
-        self._window_start = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._max_requests = config.max_requests
+        self._window_ns = round(config.window_seconds * 1_000_000_000)
+        self._state = time.monotonic_ns() << _COUNT_BITS
     
     async def acquire(self) -> bool:
-        async with self._lock:
-            now = time.monotonic()
-            
-            # Reset window if expired
-            if now - self._window_start >= self.config.window_seconds:
-                self._count = 0
-                self._window_start = now
-            
-            if self._count < self.config.max_requests:
-                self._count += 1
-                return True
-            return False
+        # No awaits below, so the update is atomic within the event loop
+        now = time.monotonic_ns()
+        state = self._state
+        
+        # Reset window if expired
+        if now - (state >> _COUNT_BITS) >= self._window_ns:
+            state = now << _COUNT_BITS
+        
+        if state & _COUNT_MASK < self._max_requests:
+            self._state = state + 1
+            return True
+        self._state = state
+        return False
 
 
 class SlidingWindow(RateLimiter):
-    """Sliding window rate limiter."""
+    """Sliding window rate limiter.
+    
+    Grant times live in a ring buffer of nanosecond timestamps, oldest at
+    ``_head``, so each acquire only evicts the entries that have just
+    expired. The ring starts small and doubles when full, up to
+    ``max_requests`` entries, so a large limit that is never reached does
+    not reserve memory for it.
+    """
+    
+    _INITIAL_SIZE = 16
     
     def __init__(self, config: RateLimitConfig) -> None:
         super().__init__(config)
-        self._timestamps: list[float] = []
-        self._lock = asyncio.Lock()
+        self._capacity = max(0, config.max_requests)
+        self._window_ns = round(config.window_seconds * 1_000_000_000)
+        self._timestamps = array("q")
+        self._head = 0
+        self._count = 0
     
     async def acquire(self) -> bool:
-        async with self._lock:
-            now = time.monotonic()
-            cutoff = now - self.config.window_seconds
-            
-            # Remove old timestamps
-            self._timestamps = [t for t in self._timestamps if t > cutoff]
-            
-            if len(self._timestamps) < self.config.max_requests:
-                self._timestamps.append(now)
-                return True
-            return False
+        # No awaits below, so the update is atomic within the event loop
+        now = time.monotonic_ns()
+        cutoff = now - self._window_ns
+        timestamps = self._timestamps
+        size = len(timestamps)
+        head = self._head
+        count = self._count
+        
+        # Evict expired timestamps
+        while count and timestamps[head] <= cutoff:
+            head += 1
+            if head == size:
+                head = 0
+            count -= 1
+        
+        if count == size:
+            capacity = self._capacity
+            if size == capacity:
+                self._head = head
+                self._count = count
+                return False
+            # Unwrap the full ring so the oldest entry is first, then grow it
+            timestamps = timestamps[head:] + timestamps[:head]
+            new_size = min(capacity, max(self._INITIAL_SIZE, 2 * size))
+            timestamps.frombytes(bytes(8 * (new_size - size)))
+            self._timestamps = timestamps
+            size = new_size
+            head = 0
+        
+        tail = head + count
+        if tail >= size:
+            tail -= size
+        timestamps[tail] = now
+        self._head = head
+        self._count = count + 1
+        return True
 
 
 def rate_limited(
@@ -149,10 +202,13 @@ def rate_limited(
     else:
         limiter = SlidingWindow(config)
     
+    # Bound once so each call skips the attribute lookup
+    acquire = limiter.acquire
+    
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            if not await limiter.acquire():
+            if not await acquire():
                 raise RateLimitExceededError()
             return await func(*args, **kwargs)
         return wrapper
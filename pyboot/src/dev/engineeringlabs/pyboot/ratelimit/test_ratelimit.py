@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import time
 from dev.engineeringlabs.pyboot.ratelimit import (
     RateLimitConfig,
     RateLimitStrategy,
@@ -49,6 +50,19 @@ class TestTokenBucket:
         
         await asyncio.sleep(0.15)
         assert await limiter.acquire()
+    
+    @pytest.mark.asyncio
+    async def test_partial_refill(self):
+        """Test a partially refilled bucket does not grant a token."""
+        config = RateLimitConfig(max_requests=1, window_seconds=0.2)
+        limiter = TokenBucket(config)
+        
+        assert await limiter.acquire()
+        await asyncio.sleep(0.05)
+        assert not await limiter.acquire()
+        
+        await asyncio.sleep(0.2)
+        assert await limiter.acquire()
 
 
 class TestFixedWindow:
@@ -86,6 +100,41 @@ class TestFixedWindow:
         assert await limiter.acquire()
 
 
+class TestLeakyBucket:
+    """Tests for LeakyBucket rate limiter."""
+    
+    @pytest.mark.asyncio
+    async def test_denies_over_limit(self):
+        """Test requests over limit are denied."""
+        config = RateLimitConfig(max_requests=2, window_seconds=1.0)
+        limiter = LeakyBucket(config)
+        
+        assert await limiter.acquire()
+        assert await limiter.acquire()
+        assert not await limiter.acquire()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires(self):
+        """Test concurrent acquires admit exactly max_requests."""
+        config = RateLimitConfig(max_requests=5, window_seconds=1.0)
+        limiter = LeakyBucket(config)
+        
+        results = await asyncio.gather(*(limiter.acquire() for _ in range(20)))
+        assert sum(results) == 5
+    
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        """Test permits return once the window has passed."""
+        config = RateLimitConfig(max_requests=1, window_seconds=0.1)
+        limiter = LeakyBucket(config)
+        
+        assert await limiter.acquire()
+        assert not await limiter.acquire()
+        
+        await asyncio.sleep(0.15)
+        assert await limiter.acquire()
+
+
 class TestSlidingWindow:
     """Tests for SlidingWindow rate limiter."""
     
@@ -122,6 +171,51 @@ class TestSlidingWindow:
         # After first request expires
         await asyncio.sleep(0.15)
         assert await limiter.acquire()
+        assert not await limiter.acquire()
+    
+    @pytest.mark.asyncio
+    async def test_reuses_slots_across_windows(self):
+        """Test the window keeps admitting after wrapping around."""
+        config = RateLimitConfig(max_requests=3, window_seconds=0.05)
+        limiter = SlidingWindow(config)
+        
+        for _ in range(3):
+            assert all([await limiter.acquire() for _ in range(3)])
+            assert not await limiter.acquire()
+            await asyncio.sleep(0.06)
+    
+    @pytest.mark.asyncio
+    async def test_large_limit_not_preallocated(self):
+        """Test the timestamp ring grows with use rather than max_requests."""
+        config = RateLimitConfig(max_requests=10_000_000, window_seconds=1.0)
+        limiter = SlidingWindow(config)
+        
+        for _ in range(20):
+            assert await limiter.acquire()
+        assert len(limiter._timestamps) < 100
+    
+    @pytest.mark.asyncio
+    async def test_grows_while_wrapped(self, monkeypatch):
+        """Test growing a wrapped ring keeps the oldest entries first."""
+        clock = [0]
+        monkeypatch.setattr(time, "monotonic_ns", lambda: clock[0])
+        config = RateLimitConfig(max_requests=40, window_seconds=100e-9)
+        limiter = SlidingWindow(config)
+        
+        # Fill the initial ring and expire 0..8, so it wraps before growing
+        for t in range(16):
+            clock[0] = t
+            assert await limiter.acquire()
+        clock[0] = 108
+        for _ in range(33):
+            assert await limiter.acquire()
+        assert not await limiter.acquire()
+        
+        # Entries granted at 9..15 expire one by one, oldest first
+        for t in range(109, 116):
+            clock[0] = t
+            assert await limiter.acquire()
+            assert not await limiter.acquire()
 
 
 class TestRateLimitedDecorator:
@@ -148,6 +242,18 @@ class TestRateLimitedDecorator:
         
         with pytest.raises(RateLimitExceededError):
             await api_call()
+    
+    @pytest.mark.asyncio
+    async def test_passes_arguments(self):
+        """Test decorated function receives its arguments."""
+        @rate_limited(max_requests=2, window_seconds=1.0)
+        async def api_call(a, *, b):
+            """Add two numbers."""
+            return a + b
+        
+        assert await api_call(1, b=2) == 3
+        assert api_call.__name__ == "api_call"
+        assert api_call.__doc__ == "Add two numbers."
 
 
 class TestRateLimitConfig:
@@ -170,3 +276,11 @@ class TestRateLimitConfig:
         assert config.strategy == RateLimitStrategy.SLIDING_WINDOW
         assert config.max_requests == 10
         assert config.window_seconds == 5.0
+    
+    def test_config_is_frozen(self):
+        """Test config is immutable and hashable."""
+        config = RateLimitConfig(max_requests=10)
+        
+        with pytest.raises(AttributeError):
+            config.max_requests = 20
+        assert hash(config) == hash(RateLimitConfig(max_requests=10))
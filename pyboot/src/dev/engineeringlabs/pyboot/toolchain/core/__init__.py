@@ -1,5 +1,6 @@
 """Toolchain Core - Build and environment utilities."""
 
+import functools
 import os
 import sys
 import platform
@@ -8,6 +9,7 @@ from datetime import datetime
 from dev.engineeringlabs.pyboot.toolchain.api import Environment, BuildMode
 
 
+@functools.cache
 def get_version() -> str:
     """Get the pyboot version."""
     try:
@@ -17,28 +19,47 @@ def get_version() -> str:
         return "0.0.0"
 
 
+@functools.cache
 def get_python_version() -> str:
     """Get the Python version."""
     return platform.python_version()
 
 
+@functools.cache
+def _get_platform() -> str:
+    """Get the platform description (constant per process)."""
+    return platform.platform()
+
+
+_ENV_VARS = ("ENV", "ENVIRONMENT", "APP_ENV", "PYTHON_ENV")
+
+# Lower-cased variable values recognised by get_environment
+_ENV_NAMES = {
+    "prod": Environment.PRODUCTION,
+    "production": Environment.PRODUCTION,
+    "stage": Environment.STAGING,
+    "staging": Environment.STAGING,
+    "test": Environment.TEST,
+    "testing": Environment.TEST,
+    "dev": Environment.DEVELOPMENT,
+    "development": Environment.DEVELOPMENT,
+}
+
+
 def get_environment() -> Environment:
     """Detect the current environment from ENV vars.
     
     Checks: ENV, ENVIRONMENT, APP_ENV, PYTHON_ENV
-    """
-    env_vars = ["ENV", "ENVIRONMENT", "APP_ENV", "PYTHON_ENV"]
     
-    for var in env_vars:
-        value = os.environ.get(var, "").lower()
-        if value in ("prod", "production"):
-            return Environment.PRODUCTION
-        elif value in ("stage", "staging"):
-            return Environment.STAGING
-        elif value in ("test", "testing"):
-            return Environment.TEST
-        elif value in ("dev", "development"):
-            return Environment.DEVELOPMENT
+    Not cached, since the variables may change at runtime.
+    """
+    environ = os.environ
+    for var in _ENV_VARS:
+        value = environ.get(var)
+        if value:
+            environment = _ENV_NAMES.get(value.lower())
+            if environment is not None:
+                return environment
     
     # Default based on __debug__ flag
     return Environment.DEVELOPMENT if __debug__ else Environment.PRODUCTION
@@ -70,7 +91,7 @@ def get_build_info() -> BuildInfo:
     return BuildInfo(
         version=get_version(),
         python_version=get_python_version(),
-        platform=platform.platform(),
+        platform=_get_platform(),
         environment=get_environment(),
         build_mode=BuildMode.DEBUG if is_debug() else BuildMode.RELEASE,
         timestamp=datetime.now().isoformat(),
@@ -68,11 +68,26 @@ class TestGetEnvironment:
             
             os.environ["ENV"] = "development"
             assert get_environment() == Environment.DEVELOPMENT
+            
+            # Later changes are picked up
+            os.environ["ENV"] = "production"
+            assert get_environment() == Environment.PRODUCTION
         finally:
             if original:
                 os.environ["ENV"] = original
             elif "ENV" in os.environ:
                 del os.environ["ENV"]
+    
+    def test_variable_priority(self, monkeypatch):
+        """Test the first recognised variable wins and unknown values are skipped."""
+        monkeypatch.setenv("ENV", "unknown")
+        monkeypatch.setenv("ENVIRONMENT", "")
+        monkeypatch.setenv("APP_ENV", "Stage")
+        monkeypatch.setenv("PYTHON_ENV", "prod")
+        assert get_environment() == Environment.STAGING
+        
+        monkeypatch.setenv("ENV", "TESTING")
+        assert get_environment() == Environment.TEST
 
 
 class TestIsDebug:
@@ -5,6 +5,7 @@ Provides UUID generation:
 - UUID v4 (random)
 - UUID v7 (time-sorted)
 - ULID generation
+- Batch generation (uuid4_many, ulid_many)
 """
 
 from dev.engineeringlabs.pyboot.uuid.api import (
@@ -15,6 +16,8 @@ from dev.engineeringlabs.pyboot.uuid.core import (
     uuid4,
     uuid7,
     ulid,
+    uuid4_many,
+    ulid_many,
     is_valid_uuid,
     parse_uuid,
 )
@@ -26,6 +29,8 @@ __all__ = [
     "uuid4",
     "uuid7",
     "ulid",
+    "uuid4_many",
+    "ulid_many",
     "is_valid_uuid",
     "parse_uuid",
 ]
@@ -1,14 +1,36 @@
 """UUID Core - UUID generation implementations."""
 
+import os
 import uuid as _uuid
 import time
-import random
 from typing import Any
 
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# UUID v7 layout: version nibble and RFC 4122 variant bits at their final positions
+_UUID7_VERSION = 0x7 << 76
+_UUID7_VARIANT = 0b10 << 62
+_RAND_B_MASK = (1 << 62) - 1
+
+# Crockford's Base32: maps each 5-bit group value (0-31) to its ASCII digit
+_CROCKFORD_TABLE = bytes.maketrans(bytes(range(32)), b"0123456789ABCDEFGHJKMNPQRSTVWXYZ")
+
+# Shifts extracting the 26 five-bit groups of a ULID, most significant first
+_ULID_SHIFTS = tuple(range(125, -1, -5))
+
+# Per-byte tables setting the UUID v4 version nibble and RFC 4122 variant bits
+_V4_VERSION_TABLE = bytes((b & 0x0F) | 0x40 for b in range(256))
+_V4_VARIANT_TABLE = bytes((b & 0x3F) | 0x80 for b in range(256))
+
+
 def uuid4() -> str:
     """Generate a random UUID v4."""
-    return str(_uuid.uuid4())
+    data = bytearray(os.urandom(16))
+    data[6] = _V4_VERSION_TABLE[data[6]]
+    data[8] = _V4_VARIANT_TABLE[data[8]]
+    h = data.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def uuid7() -> str:
@@ -17,30 +39,25 @@ def uuid7() -> str:
     UUID v7 includes a timestamp for time-sorted ordering.
     """
     # Get timestamp in milliseconds
-    timestamp_ms = int(time.time() * 1000)
-    
-    # 48 bits of timestamp
-    time_high = (timestamp_ms >> 16) & 0xFFFFFFFF
-    time_low = timestamp_ms & 0xFFFF
+    timestamp_ms = time.time_ns() // 1_000_000
     
     # Random bits for the rest
-    rand_a = random.getrandbits(12)
-    rand_b = random.getrandbits(62)
+    rand = int.from_bytes(os.urandom(10), "big")
     
     # Construct UUID v7
     # Format: tttttttt-tttt-7xxx-yxxx-xxxxxxxxxxxx
     # where t = timestamp, 7 = version, y = variant (8, 9, a, or b)
     uuid_int = (
-        (time_high << 96) |
-        (time_low << 80) |
-        (0x7 << 76) |  # version 7
-        (rand_a << 64) |
-        (0b10 << 62) |  # variant
-        rand_b
+        ((timestamp_ms & 0xFFFFFFFFFFFF) << 80) |
+        _UUID7_VERSION |
+        ((rand >> 68) << 64) |  # rand_a: 12 bits
+        _UUID7_VARIANT |
+        (rand & _RAND_B_MASK)  # rand_b: 62 bits
     )
     
-    hex_str = f"{uuid_int:032x}"
-    return f"{hex_str[:8]}-{hex_str[8:12]}-{hex_str[12:16]}-{hex_str[16:20]}-{hex_str[20:]}"
+    # bytes.hex() runs in C, skipping Python-level %x formatting
+    h = uuid_int.to_bytes(16, "big").hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def ulid() -> str:
@@ -49,35 +66,64 @@ def ulid() -> str:
     ULIDs are 128-bit identifiers that are lexicographically sortable.
     """
     # 48 bits of timestamp (milliseconds)
-    timestamp_ms = int(time.time() * 1000)
+    timestamp_ms = time.time_ns() // 1_000_000
     
     # 80 bits of randomness
-    random_bits = random.getrandbits(80)
+    random_bits = int.from_bytes(os.urandom(10), "big")
     
-    # Crockford's Base32 encoding
-    alphabet = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
-    
-    # Encode timestamp (10 characters)
-    time_chars = []
-    t = timestamp_ms
-    for _ in range(10):
-        time_chars.append(alphabet[t & 0x1F])
-        t >>= 5
-    time_str = "".join(reversed(time_chars))
-    
-    # Encode random (16 characters)
-    rand_chars = []
-    r = random_bits
-    for _ in range(16):
-        rand_chars.append(alphabet[r & 0x1F])
-        r >>= 5
-    rand_str = "".join(reversed(rand_chars))
-    
-    return time_str + rand_str
+    return _encode_ulid((timestamp_ms << 80) | random_bits)
+
+
+def _encode_ulid(value: int) -> str:
+    """Encode a 128-bit ULID value as 26 Crockford Base32 characters."""
+    # Split into 5-bit groups and encode them in a single C-level translate
+    groups = bytes([(value >> shift) & 0x1F for shift in _ULID_SHIFTS])
+    return groups.translate(_CROCKFORD_TABLE).decode("ascii")
+
+
+def uuid4_many(n: int) -> list[str]:
+    """Generate ``n`` random UUID v4 strings.
+
+    Draws all entropy with a single ``os.urandom`` call and patches the
+    version/variant bits of every record at once.
+    """
+    data = bytearray(os.urandom(16 * n))
+    data[6::16] = data[6::16].translate(_V4_VERSION_TABLE)
+    data[8::16] = data[8::16].translate(_V4_VARIANT_TABLE)
+    h = data.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
+
+
+def ulid_many(n: int) -> list[str]:
+    """Generate ``n`` ULIDs sharing a single timestamp read.
+
+    All entropy comes from one ``os.urandom`` call.
+    """
+    timestamp = (time.time_ns() // 1_000_000) << 80
+    data = os.urandom(10 * n)
+    from_bytes = int.from_bytes
+    return [
+        _encode_ulid(timestamp | from_bytes(data[i:i + 10], "big"))
+        for i in range(0, 10 * n, 10)
+    ]
 
 
 def is_valid_uuid(value: str) -> bool:
-    """Check if a string is a valid UUID."""
+    """Check if a string is a valid UUID.
+
+    Canonical dashed and plain 32-digit forms are checked with a single
+    set scan; braced and URN forms fall back to ``uuid.UUID``.
+    """
+    if not isinstance(value, str):
+        return False
+    if len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-":
+        hex_str = value.replace("-", "")
+        return len(hex_str) == 32 and _HEX_DIGITS.issuperset(hex_str)
+    if len(value) == 32:
+        return _HEX_DIGITS.issuperset(value)
     try:
         _uuid.UUID(value)
         return True
@@ -86,7 +132,15 @@ def is_valid_uuid(value: str) -> bool:
 
 
 def parse_uuid(value: str) -> _uuid.UUID:
-    """Parse a UUID string."""
+    """Parse a UUID string.
+
+    Canonical 8-4-4-4-12 strings are converted straight from their integer
+    value; any other form goes through the full ``uuid.UUID`` parser.
+    """
+    if len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-":
+        hex_str = value.replace("-", "")
+        if len(hex_str) == 32 and _HEX_DIGITS.issuperset(hex_str):
+            return _uuid.UUID(int=int(hex_str, 16))
     return _uuid.UUID(value)
 
 
@@ -94,6 +148,8 @@ __all__ = [
     "uuid4",
     "uuid7",
     "ulid",
+    "uuid4_many",
+    "ulid_many",
     "is_valid_uuid",
     "parse_uuid",
 ]
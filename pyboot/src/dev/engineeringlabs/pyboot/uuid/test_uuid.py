@@ -2,7 +2,12 @@
 
 import pytest
 import re
-from dev.engineeringlabs.pyboot.uuid import uuid4, uuid7, ulid, is_valid_uuid, parse_uuid
+from dev.engineeringlabs.pyboot.uuid import (
+    uuid4, uuid7, ulid, uuid4_many, ulid_many, is_valid_uuid, parse_uuid,
+)
+
+_UUID_FMT = re.compile(r'\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z')
+_ULID_FMT = re.compile(r'\A[0-9A-HJKMNP-TV-Z]{26}\Z')
 
 
 class TestUUID4:
@@ -22,8 +27,7 @@ class TestUUID4:
         """Test uuid4 has correct format."""
         id = uuid4()
         # UUID format: 8-4-4-4-12 hex chars
-        pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        assert re.match(pattern, id)
+        assert _UUID_FMT.match(id)
 
 
 class TestUUID7:
@@ -33,8 +37,7 @@ class TestUUID7:
         """Test uuid7 generates valid-looking UUID."""
         id = uuid7()
         # Should have correct format
-        pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        assert re.match(pattern, id)
+        assert _UUID_FMT.match(id)
     
     def test_generates_unique(self):
         """Test uuid7 generates unique IDs."""
@@ -61,7 +64,7 @@ class TestULID:
         id = ulid()
         # ULID is 26 chars, Crockford base32
         assert len(id) == 26
-        assert re.match(r'^[0-9A-HJKMNP-TV-Z]{26}$', id)
+        assert _ULID_FMT.match(id)
     
     def test_generates_unique(self):
         """Test ulid generates unique IDs."""
@@ -80,6 +83,30 @@ class TestULID:
         assert ids == sorted(ids)
 
 
+class TestBatch:
+    """Tests for batch generation."""
+    
+    def test_uuid4_many(self):
+        """Test uuid4_many generates unique version 4 UUIDs."""
+        ids = uuid4_many(50)
+        assert len(set(ids)) == 50
+        for id in ids:
+            parsed = parse_uuid(id)
+            assert parsed.version == 4
+            assert str(parsed) == id
+    
+    def test_ulid_many(self):
+        """Test ulid_many generates unique ULIDs."""
+        ids = ulid_many(50)
+        assert len(set(ids)) == 50
+        assert all(_ULID_FMT.match(id) for id in ids)
+    
+    def test_empty_batch(self):
+        """Test zero-sized batches."""
+        assert uuid4_many(0) == []
+        assert ulid_many(0) == []
+
+
 class TestValidation:
     """Tests for UUID validation."""
     
@@ -100,6 +127,19 @@ class TestValidation:
         # uuid.UUID accepts both formats
         assert is_valid_uuid("550e8400e29b41d4a716446655440000")
     
+    def test_braced_and_urn_forms_valid(self):
+        """Test non-canonical forms accepted by uuid.UUID stay valid."""
+        assert is_valid_uuid("{550e8400-e29b-41d4-a716-446655440000}")
+        assert is_valid_uuid("urn:uuid:550e8400-e29b-41d4-a716-446655440000")
+    
+    def test_invalid_uuid_extra_dashes(self):
+        """Test misplaced dashes are invalid."""
+        assert not is_valid_uuid("550e8400-e29b-41d4-a716-4466-5544000")
+    
+    def test_non_string_invalid(self):
+        """Test non-string values are invalid."""
+        assert not is_valid_uuid(None)
+    
     def test_generated_uuid_is_valid(self):
         """Test generated UUIDs are valid."""
         for _ in range(10):
@@ -130,3 +170,14 @@ class TestParse:
         parsed = parse_uuid("550e8400-e29b-41d4-a716-446655440000")
         assert parsed.hex == "550e8400e29b41d4a716446655440000"
         assert parsed.int > 0
+    
+    def test_parse_canonical_matches_stdlib(self):
+        """Test canonical fast path agrees with uuid.UUID."""
+        import uuid as stdlib_uuid
+        value = "550E8400-e29b-41d4-A716-446655440000"
+        assert parse_uuid(value) == stdlib_uuid.UUID(value)
+    
+    def test_parse_rejects_malformed_canonical(self):
+        """Test dashed strings with non-hex digits still raise."""
+        with pytest.raises(ValueError):
+            parse_uuid("550e8400-e29b-41d4-a716-44665544GGGG")
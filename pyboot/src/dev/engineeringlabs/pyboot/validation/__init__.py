@@ -5,6 +5,7 @@ This module provides:
 - Validators: Reusable validation rules
 - Validation decorator for functions
 - Result-based validation
+- Compiled schemas for validating many dicts against one schema
 
 Example:
     from dev.engineeringlabs.pyboot.validation import validate, required, email, min_length
@@ -53,6 +54,9 @@ from dev.engineeringlabs.pyboot.validation.api import (
 from dev.engineeringlabs.pyboot.validation.core import (
     validate,
     validate_dict,
+    compile_chain,
+    compile_schema,
+    validate_batch,
     validated,
 )
 
@@ -80,6 +84,9 @@ __all__ = [
     # Core
     "validate",
     "validate_dict",
+    "compile_chain",
+    "compile_schema",
+    "validate_batch",
     "validated",
 ]
 
@@ -1,5 +1,6 @@
 """Validation exceptions."""
 
+from itertools import islice
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,7 +21,7 @@ class ValidationError(Exception):
 
     def __str__(self) -> str:
         if self.errors:
-            error_msgs = [f"{e.field}: {e.message}" for e in self.errors[:3]]
+            error_msgs = [f"{e.field}: {e.message}" for e in islice(self.errors, 3)]
             if len(self.errors) > 3:
                 error_msgs.append(f"... and {len(self.errors) - 3} more")
             return f"{self.message}: {', '.join(error_msgs)}"
@@ -3,10 +3,17 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+from dev.engineeringlabs.pyboot.validation.api.exceptions import ValidationError
 
-@dataclass(frozen=True, slots=True)
+
+@dataclass(slots=True)
 class FieldError:
-    """An error for a specific field."""
+    """An error for a specific field.
+
+    Not frozen: the generated frozen ``__init__`` goes through
+    ``object.__setattr__`` for every field, which dominates the cost when
+    validation produces many errors. Being mutable, it is unhashable.
+    """
 
     field: str
     message: str
@@ -15,13 +22,9 @@ class FieldError:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        result: dict[str, Any] = {
-            "field": self.field,
-            "message": self.message,
-        }
         if self.code:
-            result["code"] = self.code
-        return result
+            return {"field": self.field, "message": self.message, "code": self.code}
+        return {"field": self.field, "message": self.message}
 
 
 @dataclass(slots=True)
@@ -33,12 +36,12 @@ class ValidationResult:
     @property
     def is_valid(self) -> bool:
         """Check if validation passed."""
-        return len(self.errors) == 0
+        return not self.errors
 
     @property
     def is_invalid(self) -> bool:
         """Check if validation failed."""
-        return len(self.errors) > 0
+        return bool(self.errors)
 
     def add_error(
         self,
@@ -56,16 +59,17 @@ class ValidationResult:
 
     def get_first_error(self, field: str) -> FieldError | None:
         """Get the first error for a field."""
-        errors = self.get_errors(field)
-        return errors[0] if errors else None
+        return next((e for e in self.errors if e.field == field), None)
 
     def error_messages(self) -> dict[str, list[str]]:
         """Get error messages grouped by field."""
         result: dict[str, list[str]] = {}
         for error in self.errors:
-            if error.field not in result:
-                result[error.field] = []
-            result[error.field].append(error.message)
+            messages = result.get(error.field)
+            if messages is None:
+                result[error.field] = [error.message]
+            else:
+                messages.append(error.message)
         return result
 
     def to_dict(self) -> dict[str, Any]:
@@ -77,8 +81,6 @@ class ValidationResult:
 
     def raise_if_invalid(self) -> None:
         """Raise ValidationError if invalid."""
-        from dev.engineeringlabs.pyboot.validation.api.exceptions import ValidationError
-
         if self.is_invalid:
             raise ValidationError(
                 "Validation failed",
@@ -1,12 +1,18 @@
 """Validator interface."""
 
-from abc import ABC, abstractmethod
-from typing import Any
+from abc import abstractmethod
+from typing import Any, Protocol, runtime_checkable
 
 
-class Validator(ABC):
+@runtime_checkable
+class Validator(Protocol):
     """
-    Abstract validator interface.
+    Validator protocol.
+
+    Objects with ``validate`` and ``__call__`` methods satisfy it
+    structurally. Explicit subclasses inherit ``__call__`` and must
+    implement ``validate``; it stays abstract so a missing or misspelled
+    ``validate`` fails at instantiation instead of accepting every value.
 
     Example:
         class EmailValidator(Validator):
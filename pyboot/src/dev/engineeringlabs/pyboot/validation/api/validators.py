@@ -1,11 +1,19 @@
 """Common validators."""
 
+import functools
+import ipaddress
 import re
+import uuid as _uuid
 from typing import Any, Sequence
 
 from dev.engineeringlabs.pyboot.validation.api.validator import Validator
 
 
+# Pattern validators are often built per call via pattern(); keep their
+# compiled regexes out of re's small shared cache
+_compile_pattern = functools.lru_cache(maxsize=1024)(re.compile)
+
+
 class Required(Validator):
     """Validate that a value is present."""
 
@@ -15,6 +23,9 @@ class Required(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return self._message
+        # Exact-type check first: plain str is by far the common case
+        if type(value) is str:
+            return None if value.strip() else self._message
         if isinstance(value, str) and not value.strip():
             return self._message
         return None
@@ -29,6 +40,9 @@ class NotEmpty(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return self._message
+        value_type = type(value)
+        if value_type is str or value_type is list or value_type is dict or value_type is set:
+            return None if value else self._message
         if isinstance(value, (str, list, dict, set)) and len(value) == 0:
             return self._message
         return None
@@ -44,7 +58,11 @@ class MinLength(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None  # Use Required for null check
-        if hasattr(value, "__len__") and len(value) < self._min_len:
+        try:
+            length = len(value)
+        except TypeError:
+            return None
+        if length < self._min_len:
             return self._message
         return None
 
@@ -59,7 +77,11 @@ class MaxLength(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        if hasattr(value, "__len__") and len(value) > self._max_len:
+        try:
+            length = len(value)
+        except TypeError:
+            return None
+        if length > self._max_len:
             return self._message
         return None
 
@@ -68,13 +90,13 @@ class Pattern(Validator):
     """Validate against a regex pattern."""
 
     def __init__(self, pattern: str, message: str = "Invalid format"):
-        self._pattern = re.compile(pattern)
+        self._pattern = _compile_pattern(pattern)
         self._message = message
 
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
             return self._message
         if not self._pattern.match(value):
             return self._message
@@ -84,8 +106,10 @@ class Pattern(Validator):
 class Email(Validator):
     """Validate email format."""
 
+    # Possessive local part: it cannot contain "@", so giving back characters
+    # can never help the match and the engine need not backtrack into it
     _EMAIL_PATTERN = re.compile(
-        r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+        r"^[a-zA-Z0-9._%+-]++@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}+$"
     )
 
     def __init__(self, message: str = "Invalid email address"):
@@ -94,7 +118,11 @@ class Email(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
+            return self._message
+        # Cheap rejections before the regex; 254 is the RFC 5321 address limit
+        n = len(value)
+        if n < 6 or n > 254 or "@" not in value:
             return self._message
         if not self._EMAIL_PATTERN.match(value):
             return self._message
@@ -105,7 +133,7 @@ class Url(Validator):
     """Validate URL format."""
 
     _URL_PATTERN = re.compile(
-        r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE
+        r"^https?://[^\s/$.?#].[^\s]*+$", re.IGNORECASE
     )
 
     def __init__(self, message: str = "Invalid URL"):
@@ -114,7 +142,10 @@ class Url(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
+            return self._message
+        # Cheap scheme check before the regex (which is case-insensitive)
+        if not value[:8].lower().startswith(("http://", "https://")):
             return self._message
         if not self._URL_PATTERN.match(value):
             return self._message
@@ -131,10 +162,13 @@ class MinValue(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        try:
-            if float(value) < self._min_val:
+        value_type = type(value)
+        if value_type is not int and value_type is not float:
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
                 return self._message
-        except (ValueError, TypeError):
+        if value < self._min_val:
             return self._message
         return None
 
@@ -149,10 +183,13 @@ class MaxValue(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        try:
-            if float(value) > self._max_val:
+        value_type = type(value)
+        if value_type is not int and value_type is not float:
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
                 return self._message
-        except (ValueError, TypeError):
+        if value > self._max_val:
             return self._message
         return None
 
@@ -168,11 +205,13 @@ class InRange(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        try:
-            val = float(value)
-            if val < self._min_val or val > self._max_val:
+        value_type = type(value)
+        if value_type is not int and value_type is not float:
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
                 return self._message
-        except (ValueError, TypeError):
+        if value < self._min_val or value > self._max_val:
             return self._message
         return None
 
@@ -182,11 +221,26 @@ class OneOf(Validator):
 
     def __init__(self, choices: Sequence[Any], message: str | None = None):
         self._choices = choices
-        self._message = message or f"Must be one of: {', '.join(str(c) for c in choices)}"
+        # Hashed lookup when every choice is hashable
+        self._choice_set: frozenset[Any] | None
+        try:
+            self._choice_set = frozenset(choices)
+        except TypeError:
+            self._choice_set = None
+        if not message:
+            message = f"Must be one of: {', '.join(str(c) for c in choices)}"
+        self._message = message
 
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
+        if self._choice_set is not None:
+            try:
+                if value in self._choice_set:
+                    return None
+                return self._message
+            except TypeError:
+                pass  # Unhashable value: compare against the sequence
         if value not in self._choices:
             return self._message
         return None
@@ -218,24 +272,23 @@ class Uuid(Validator):
             return None
         
         # Accept UUID objects
-        import uuid as uuid_module
-        if isinstance(value, uuid_module.UUID):
+        if isinstance(value, _uuid.UUID):
             return None
         
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
             return self._message
         
-        # Try parsing with uuid module for strict validation
+        # Pattern matches are always accepted by uuid.UUID too, so check the
+        # cheap compiled pattern first
+        if self._UUID_PATTERN.match(value):
+            return None
+        
+        # Fall back to the uuid module for other versions and braced/URN forms
         try:
-            uuid_module.UUID(value)
+            _uuid.UUID(value)
             return None
         except (ValueError, AttributeError):
-            pass
-        
-        # Fallback to pattern matching
-        if not self._UUID_PATTERN.match(value):
             return self._message
-        return None
 
 
 class Phone(Validator):
@@ -255,19 +308,28 @@ class Phone(Validator):
         validator.validate("123")                  # Invalid
     """
     
-    # Comprehensive phone pattern
-    _PHONE_PATTERNS = [
+    # Known phone formats, combined into one alternation so a single match
+    # call covers all of them
+    _PHONE_PATTERN = re.compile(
+        r"^(?:"
         # E.164 format: +[country][number] (7-15 digits)
-        re.compile(r"^\+[1-9]\d{6,14}$"),
+        r"\+[1-9]\d{6,14}"
         # International with spaces/dashes
-        re.compile(r"^\+[1-9][\d\s\-]{6,20}$"),
+        r"|\+[1-9][\d\s\-]{6,20}"
         # US format: (xxx) xxx-xxxx
-        re.compile(r"^\(\d{3}\)\s?\d{3}[-.]?\d{4}$"),
+        r"|\(\d{3}\)\s?\d{3}[-.]?\d{4}"
         # US format without parentheses: xxx-xxx-xxxx
-        re.compile(r"^\d{3}[-.\s]?\d{3}[-.\s]?\d{4}$"),
+        r"|\d{3}[-.\s]?\d{3}[-.\s]?\d{4}"
         # 10+ digit number
-        re.compile(r"^\d{10,15}$"),
-    ]
+        r"|\d{10,15}"
+        r")$"
+    )
+    
+    # Deletes the separators that re's \s|-|(|)|. would strip: every
+    # Unicode whitespace character (all lie below U+3001) plus "-().".
+    _STRIP_TABLE = str.maketrans(
+        "", "", "".join(c for c in map(chr, range(0x3001)) if c.isspace()) + "-()."
+    )
     
     def __init__(
         self,
@@ -282,11 +344,11 @@ class Phone(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
             return self._message
         
         # Normalize: remove spaces, dashes, parentheses for digit count
-        cleaned = re.sub(r"[\s\-\(\)\.]", "", value)
+        cleaned = value.translate(self._STRIP_TABLE)
         
         # Remove leading + for digit count
         digits_only = cleaned.lstrip("+")
@@ -298,9 +360,8 @@ class Phone(Validator):
             return self._message
         
         # Check against known patterns
-        for pattern in self._PHONE_PATTERNS:
-            if pattern.match(value):
-                return None
+        if self._PHONE_PATTERN.match(value):
+            return None
         
         # Accept if it has valid digit count even without matching pattern
         if self._min_digits <= len(digits_only) <= self._max_digits:
@@ -351,47 +412,44 @@ class IpAddress(Validator):
     def validate(self, value: Any) -> str | None:
         if value is None:
             return None
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
             return self._message
         
-        # Handle CIDR notation
+        # Handle CIDR notation, splitting off the prefix length once
         ip_part = value
+        prefix_len = -1
         if "/" in value:
             if not self._allow_cidr:
                 return self._message
             ip_part, cidr = value.rsplit("/", 1)
-            if not cidr.isdigit():
+            # ASCII digits only, as ipaddress requires; isdecimal alone
+            # admits other scripts' digits and int() would accept them
+            if not (cidr.isascii() and cidr.isdecimal()):
                 return self._message
-            cidr_int = int(cidr)
-            # Validate CIDR range later based on IP version
+            prefix_len = int(cidr)
         
         # Try using ipaddress module for validation
         try:
-            import ipaddress
-            
             if self._version == 4:
-                addr = ipaddress.IPv4Address(ip_part)
-                if "/" in value and int(value.rsplit("/", 1)[1]) > 32:
-                    return self._message
+                ipaddress.IPv4Address(ip_part)
+                max_prefix_len = 32
             elif self._version == 6:
-                addr = ipaddress.IPv6Address(ip_part)
-                if "/" in value and int(value.rsplit("/", 1)[1]) > 128:
-                    return self._message
+                ipaddress.IPv6Address(ip_part)
+                max_prefix_len = 128
             else:
                 # Try IPv4 first, then IPv6
                 try:
-                    addr = ipaddress.IPv4Address(ip_part)
-                    if "/" in value and int(value.rsplit("/", 1)[1]) > 32:
-                        return self._message
+                    ipaddress.IPv4Address(ip_part)
+                    max_prefix_len = 32
                 except ipaddress.AddressValueError:
-                    addr = ipaddress.IPv6Address(ip_part)
-                    if "/" in value and int(value.rsplit("/", 1)[1]) > 128:
-                        return self._message
-            
-            return None
-            
-        except (ValueError, ipaddress.AddressValueError):
+                    ipaddress.IPv6Address(ip_part)
+                    max_prefix_len = 128
+        except ValueError:  # includes ipaddress.AddressValueError
             return self._message
+        
+        if prefix_len > max_prefix_len:
+            return self._message
+        return None
 
 
 # Factory functions for cleaner usage
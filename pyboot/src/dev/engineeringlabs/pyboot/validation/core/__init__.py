@@ -1,10 +1,19 @@
 """Validation core implementations."""
 
-from dev.engineeringlabs.pyboot.validation.core.validator import validate, validate_dict
+from dev.engineeringlabs.pyboot.validation.core.validator import (
+    validate,
+    validate_dict,
+    compile_chain,
+    compile_schema,
+    validate_batch,
+)
 from dev.engineeringlabs.pyboot.validation.core.decorator import validated
 
 __all__ = [
     "validate",
     "validate_dict",
+    "compile_chain",
+    "compile_schema",
+    "validate_batch",
     "validated",
 ]
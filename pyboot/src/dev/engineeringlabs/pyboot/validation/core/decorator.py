@@ -16,6 +16,118 @@ except ImportError:
 
 T = TypeVar("T")
 
+# (param name, positional index or None, default, validators)
+_ParamSlot = tuple[str, int | None, Any, list[Validator]]
+
+
+class _CallShape:
+    """Which argument lists a signature without *args/**kwargs accepts."""
+
+    __slots__ = ("n_positional", "keywords", "required")
+
+    def __init__(self, sig: inspect.Signature) -> None:
+        self.n_positional = 0
+        # Keyword-passable name -> positional index, or None if keyword-only
+        self.keywords: dict[str, int | None] = {}
+        self.required: list[tuple[str, int | None]] = []
+        for index, param in enumerate(sig.parameters.values()):
+            positional = param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+            position = index if positional else None
+            if positional:
+                self.n_positional += 1
+            if param.kind is not param.POSITIONAL_ONLY:
+                self.keywords[param.name] = position
+            if param.default is param.empty:
+                self.required.append((param.name, position))
+
+    def accepts(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+        """Check a call would bind: no extra, unknown, duplicate or missing arguments."""
+        n_args = len(args)
+        if n_args > self.n_positional:
+            return False
+        keywords = self.keywords
+        for name in kwargs:
+            if name not in keywords:
+                return False
+            position = keywords[name]
+            if position is not None and position < n_args:
+                return False
+        for name, position in self.required:
+            if (position is None or position >= n_args) and name not in kwargs:
+                return False
+        return True
+
+
+def _param_slots(
+    sig: inspect.Signature,
+    field_validators: dict[str, list[Validator]],
+) -> tuple[list[_ParamSlot], _CallShape] | None:
+    """
+    Precompute where each validated parameter is found in a call.
+
+    Returns None when the signature takes *args or **kwargs, in which case
+    arguments have to be resolved with ``sig.bind``.
+    """
+    positions: dict[str, int | None] = {}
+    for index, param in enumerate(sig.parameters.values()):
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            return None
+        positional = param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+        positions[param.name] = index if positional else None
+
+    slots: list[_ParamSlot] = []
+    for name, validators in field_validators.items():
+        if name not in positions:
+            return None
+        default = sig.parameters[name].default
+        slots.append((
+            name,
+            positions[name],
+            None if default is inspect.Parameter.empty else default,
+            validators,
+        ))
+    return slots, _CallShape(sig)
+
+
+def _validate_arguments(
+    sig: inspect.Signature,
+    field_validators: dict[str, list[Validator]],
+    fast_path: tuple[list[_ParamSlot], _CallShape] | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> ValidationResult:
+    """
+    Validate the annotated arguments of a single call.
+
+    Calls that would not bind to the signature raise the usual TypeError
+    from ``sig.bind`` before any validation runs.
+    """
+    if fast_path is not None and fast_path[1].accepts(args, kwargs):
+        param_slots = fast_path[0]
+    else:
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        param_slots = [
+            (name, None, arguments.get(name), validators)
+            for name, validators in field_validators.items()
+        ]
+        kwargs = {}
+
+    result = ValidationResult()
+    n_args = len(args)
+    for param_name, position, default, validators in param_slots:
+        if position is not None and position < n_args:
+            value = args[position]
+        else:
+            value = kwargs.get(param_name, default)
+        for validator in validators:
+            error_message = validator.validate(value)
+            if error_message:
+                result.add_error(param_name, error_message, value)
+                break
+    return result
+
 
 def validated(
     raise_on_error: bool = True,
@@ -58,21 +170,11 @@ def validated(
                 if validators:
                     field_validators[param_name] = validators
 
+        fast_path = _param_slots(sig, field_validators)
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            # Bind arguments to signature
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-
-            # Validate
-            result = ValidationResult()
-            for param_name, validators in field_validators.items():
-                value = bound.arguments.get(param_name)
-                for validator in validators:
-                    error_message = validator.validate(value)
-                    if error_message:
-                        result.add_error(param_name, error_message, value)
-                        break
+            result = _validate_arguments(sig, field_validators, fast_path, args, kwargs)
 
             if result.is_invalid:
                 if raise_on_error:
@@ -117,19 +219,11 @@ def validated_sync(
                 if validators:
                     field_validators[param_name] = validators
 
+        fast_path = _param_slots(sig, field_validators)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-
-            result = ValidationResult()
-            for param_name, validators in field_validators.items():
-                value = bound.arguments.get(param_name)
-                for validator in validators:
-                    error_message = validator.validate(value)
-                    if error_message:
-                        result.add_error(param_name, error_message, value)
-                        break
+            result = _validate_arguments(sig, field_validators, fast_path, args, kwargs)
 
             if result.is_invalid and raise_on_error:
                 raise ValidationError("Validation failed", errors=result.errors)
@@ -1,5 +1,6 @@
 """Core validation functions."""
 
+from collections.abc import Callable, Iterable
 from typing import Any, Sequence
 
 from dev.engineeringlabs.pyboot.validation.api.validator import Validator
@@ -30,12 +31,13 @@ def validate(
                 print(f"{error.field}: {error.message}")
     """
     result = ValidationResult()
+    add_error = result.add_error
 
     for field_name, value, validators in field_validations:
         for validator in validators:
             error_message = validator.validate(value)
             if error_message:
-                result.add_error(field_name, error_message, value)
+                add_error(field_name, error_message, value)
                 break  # Stop on first error for this field
 
     return result
@@ -66,18 +68,136 @@ def validate_dict(
         result.raise_if_invalid()
     """
     result = ValidationResult()
+    add_error = result.add_error
+    get = data.get
 
     for field_name, validators in schema.items():
-        value = data.get(field_name)
+        value = get(field_name)
         for validator in validators:
             error_message = validator.validate(value)
             if error_message:
-                result.add_error(field_name, error_message, value)
+                add_error(field_name, error_message, value)
                 break
 
     return result
 
 
+def compile_chain(
+    validators: Sequence[Validator],
+) -> Callable[[Any], str | None]:
+    """
+    Compile a list of validators into a single callable.
+
+    The returned function runs the validators in order and returns the
+    first error message, like the inner loop of ``validate``. Short
+    chains are unrolled into ``or`` expressions over the bound
+    ``validate`` methods.
+
+    Args:
+        validators: Validators to chain
+
+    Returns:
+        Function taking a value and returning an error message or a
+        falsy value when every validator passes
+
+    Example:
+        check_email = compile_chain([required(), email()])
+        error = check_email(user_email)
+    """
+    checks = tuple(validator.validate for validator in validators)
+
+    if not checks:
+        return lambda value: None
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+        return lambda value: first(value) or second(value)
+    if len(checks) == 3:
+        first, second, third = checks
+        return lambda value: first(value) or second(value) or third(value)
+
+    def chain(value: Any) -> str | None:
+        for check in checks:
+            error_message = check(value)
+            if error_message:
+                return error_message
+        return None
+
+    return chain
+
+
+def compile_schema(
+    schema: dict[str, Sequence[Validator]],
+) -> Callable[[dict[str, Any]], ValidationResult]:
+    """
+    Compile a schema into a reusable validation function.
+
+    The schema is snapshotted and each field's validators are compiled
+    into a chain with ``compile_chain``, so repeated validation against
+    the same schema skips the per-call schema walk and method lookups.
+    Later changes to ``schema`` are not picked up; compile again instead.
+
+    Args:
+        schema: Mapping of field names to validators
+
+    Returns:
+        Function taking a data dictionary and returning a ValidationResult,
+        equivalent to ``validate_dict(data, schema)``
+
+    Example:
+        validate_user = compile_schema({
+            "email": [required(), email()],
+            "password": [required(), min_length(8)],
+        })
+
+        for payload in payloads:
+            validate_user(payload).raise_if_invalid()
+    """
+    fields = tuple(
+        (field_name, compile_chain(validators))
+        for field_name, validators in schema.items()
+    )
+
+    def validate_compiled(data: dict[str, Any]) -> ValidationResult:
+        result = ValidationResult()
+        add_error = result.add_error
+        get = data.get
+        for field_name, check in fields:
+            value = get(field_name)
+            error_message = check(value)
+            if error_message:
+                add_error(field_name, error_message, value)
+        return result
+
+    return validate_compiled
+
+
+def validate_batch(
+    records: Iterable[dict[str, Any]],
+    schema: dict[str, Sequence[Validator]],
+) -> list[ValidationResult]:
+    """
+    Validate many dictionaries against the same schema.
+
+    The schema is compiled once with ``compile_schema`` and applied to
+    every record.
+
+    Args:
+        records: Dictionaries to validate
+        schema: Mapping of field names to validators
+
+    Returns:
+        One ValidationResult per record, in order
+
+    Example:
+        results = validate_batch(rows, {"email": [required(), email()]})
+        invalid = [i for i, r in enumerate(results) if r.is_invalid]
+    """
+    validate_record = compile_schema(schema)
+    return [validate_record(record) for record in records]
+
+
 def validate_all(
     *field_validations: tuple[str, Any, Sequence[Validator]],
 ) -> ValidationResult:
@@ -91,14 +211,22 @@ def validate_all(
         ValidationResult with all errors
     """
     result = ValidationResult()
+    add_error = result.add_error
 
     for field_name, value, validators in field_validations:
         for validator in validators:
             error_message = validator.validate(value)
             if error_message:
-                result.add_error(field_name, error_message, value)
+                add_error(field_name, error_message, value)
 
     return result
 
 
-__all__ = ["validate", "validate_dict", "validate_all"]
+__all__ = [
+    "validate",
+    "validate_dict",
+    "validate_all",
+    "compile_chain",
+    "compile_schema",
+    "validate_batch",
+]
@@ -0,0 +1,498 @@
+"""Tests for validation module."""
+
+import dataclasses
+import uuid as _uuid
+from typing import Annotated
+
+import pytest
+from dev.engineeringlabs.pyboot.validation import (
+    FieldError,
+    ValidationError,
+    ValidationResult,
+    Validator,
+    compile_chain,
+    compile_schema,
+    email,
+    in_range,
+    ip_address,
+    max_length,
+    max_value,
+    min_length,
+    min_value,
+    not_empty,
+    one_of,
+    pattern,
+    phone,
+    required,
+    url,
+    uuid,
+    validate_batch,
+    validate_dict,
+    validated,
+)
+from dev.engineeringlabs.pyboot.validation.core.decorator import validated_sync
+
+
+class TestFieldError:
+    """Tests for FieldError."""
+    
+    def test_equality(self):
+        """Test errors compare by value."""
+        assert FieldError("a", "msg", 1) == FieldError("a", "msg", 1)
+        assert FieldError("a", "msg") != FieldError("a", "msg", code="x")
+    
+    def test_unhashable(self):
+        """Test mutable errors cannot be used as set members."""
+        with pytest.raises(TypeError):
+            hash(FieldError("a", "msg"))
+    
+    def test_to_dict(self):
+        """Test code is only included when set."""
+        assert FieldError("a", "msg").to_dict() == {"field": "a", "message": "msg"}
+        assert FieldError("a", "msg", code="c").to_dict()["code"] == "c"
+    
+    def test_dataclass_helpers(self):
+        """Test asdict, replace and fields work on errors and results."""
+        error = FieldError("a", "msg", 1)
+        result = ValidationResult([error])
+        
+        assert dataclasses.asdict(result) == {
+            "errors": [{"field": "a", "message": "msg", "value": 1, "code": None}],
+        }
+        assert dataclasses.replace(error, code="c") == FieldError("a", "msg", 1, "c")
+        assert [f.name for f in dataclasses.fields(FieldError)] == ["field", "message", "value", "code"]
+
+
+class TestValidationResult:
+    """Tests for ValidationResult."""
+    
+    def test_empty_result_is_valid(self):
+        """Test a result without errors is valid."""
+        result = ValidationResult()
+        assert result.is_valid
+        assert not result.is_invalid
+        assert result.error_messages() == {}
+        assert result.get_first_error("a") is None
+    
+    def test_errors_grouped_by_field(self):
+        """Test errors are grouped by field in insertion order."""
+        result = ValidationResult()
+        result.add_error("a", "first")
+        result.add_error("b", "second")
+        result.add_error("a", "third")
+        
+        assert result.is_invalid
+        assert [e.message for e in result.get_errors("a")] == ["first", "third"]
+        assert result.get_first_error("b").message == "second"
+        assert result.error_messages() == {"a": ["first", "third"], "b": ["second"]}
+    
+    def test_queries_see_direct_edits(self):
+        """Test editing errors in place is reflected by later queries."""
+        result = ValidationResult()
+        result.add_error("a", "first")
+        assert result.get_errors("a")
+        
+        result.errors[0] = FieldError("b", "replaced")
+        
+        assert result.get_errors("a") == []
+        assert result.get_first_error("b").message == "replaced"
+        assert result.error_messages() == {"b": ["replaced"]}
+
+
+# (validator, value, accepted) rows for the built-in validators
+_VALIDATOR_CASES = [
+    (required(), None, False),
+    (required(), "", False),
+    (required(), "  ", False),
+    (required(), "\u3000", False),
+    (required(), "x", True),
+    (required(), 0, True),
+    (required(), [], True),
+    (not_empty(), None, False),
+    (not_empty(), "", False),
+    (not_empty(), [], False),
+    (not_empty(), {}, False),
+    (not_empty(), set(), False),
+    (not_empty(), "a", True),
+    (not_empty(), [0], True),
+    (not_empty(), 0, True),
+    (not_empty(), (), True),
+    (min_length(2), "a", False),
+    (min_length(2), "ab", True),
+    (min_length(2), [1], False),
+    (min_length(2), 5, True),
+    (max_length(2), "abc", False),
+    (max_length(2), "ab", True),
+    (pattern(r"\d+"), "12", True),
+    (pattern(r"\d+"), "ab", False),
+    (pattern(r"\d+"), 12, False),
+    (email(), "user@example.com", True),
+    (email(), "first.last+tag@sub.example.co", True),
+    (email(), "a@b.cd", True),
+    (email(), "user@@example.com", False),
+    (email(), "user@example", False),
+    (email(), "@example.com", False),
+    (email(), "a@b.c", False),
+    (email(), "user@exa mple.com", False),
+    (email(), "user@example.c0m", False),
+    (email(), "a" * 60 + "@", False),
+    (email(), 123, False),
+    (url(), "https://example.com", True),
+    (url(), "HTTP://EXAMPLE.COM/path?q=1", True),
+    (url(), "ftp://example.com", False),
+    (url(), "http://", False),
+    (url(), "https://exa mple.com", False),
+    (url(), "http:/example.com", False),
+    (url(), "https://.com", False),
+    (url(), 42, False),
+    (min_value(0), 0, True),
+    (min_value(0), -1, False),
+    (min_value(0), 0.5, True),
+    (min_value(0), True, True),
+    (min_value(0), False, True),
+    (min_value(0), 2**70, True),
+    (min_value(0), -(2**70), False),
+    (min_value(0), "5", True),
+    (min_value(0), "-5", False),
+    (min_value(0), "abc", False),
+    (min_value(0), [], False),
+    (max_value(10), 10, True),
+    (max_value(10), 10.5, False),
+    (max_value(10), True, True),
+    (max_value(10), 2**70, False),
+    (max_value(10), -(2**70), True),
+    (max_value(10), "10", True),
+    (max_value(10), "x", False),
+    (in_range(0, 1), 0, True),
+    (in_range(0, 1), 1, True),
+    (in_range(0, 1), 0.5, True),
+    (in_range(0, 1), True, True),
+    (in_range(0, 1), False, True),
+    (in_range(0, 1), 2**70, False),
+    (in_range(0, 1), -0.1, False),
+    (in_range(0, 1), "0.5", True),
+    (in_range(0, 1), [], False),
+    (one_of(["a", "b"]), "a", True),
+    (one_of(["a", "b"]), "c", False),
+    (one_of(["a", "b"]), ["a"], False),
+    (one_of(["a", "b"]), {"a": 1}, False),
+    (one_of([1, 2]), True, True),
+    (one_of([1, 2]), 2.0, True),
+    (one_of([1, 2]), "1", False),
+    (one_of([["x"], "a"]), ["x"], True),
+    (one_of([["x"], "a"]), "a", True),
+    (one_of([["x"], "a"]), ["y"], False),
+    (uuid(), "550e8400-e29b-41d4-a716-446655440000", True),
+    (uuid(), "550e8400e29b41d4a716446655440000", True),
+    (uuid(), "550E8400-E29B-41D4-A716-446655440000", True),
+    (uuid(), "{550e8400-e29b-41d4-a716-446655440000}", True),
+    (uuid(), "urn:uuid:550e8400-e29b-41d4-a716-446655440000", True),
+    (uuid(), "00000000-0000-0000-0000-000000000000", True),
+    (uuid(), _uuid.UUID(int=1), True),
+    (uuid(), "invalid-uuid", False),
+    (uuid(), "550e8400-e29b-41d4-a716-44665544000", False),
+    (uuid(), 123, False),
+    (phone(), "+14155551234", True),
+    (phone(), "+1 415 555 1234", True),
+    (phone(), "(415) 555-1234", True),
+    (phone(), "415-555-1234", True),
+    (phone(), "415.555.1234", True),
+    (phone(), "415\u00a0555\u00a01234", True),  # no-break space
+    (phone(), "415\u2003555\u20031234", True),  # em space
+    (phone(), "415\u3000555\u30001234", True),  # ideographic space
+    (phone(), "415\t555\n1234", True),
+    (phone(), "123", False),
+    (phone(), "415x555x1234", False),
+    (phone(), "+1 415 555 1234 ext 123", False),
+    (phone(), "1" * 16, False),
+    (phone(), 4155551234, False),
+    # None is left to required()
+    *[
+        (validator, None, True)
+        for validator in (
+            min_length(2), max_length(2), pattern(r"\d+"), email(), url(), min_value(0),
+            max_value(10), in_range(0, 1), one_of(["a"]), uuid(), phone(),
+        )
+    ],
+]
+
+
+class TestValidators:
+    """Tests for the built-in validators."""
+    
+    @pytest.mark.parametrize("validator,value,accepted", _VALIDATOR_CASES)
+    def test_accepts_and_rejects(self, validator, value, accepted):
+        """Test each validator against its table of inputs."""
+        assert (validator.validate(value) is None) is accepted
+
+
+class TestEmail:
+    """Tests for the email validator."""
+    
+    def test_length_limit(self):
+        """Test addresses are limited to the RFC 5321 maximum of 254 characters."""
+        domain = "@example.com"
+        longest = "a" * (254 - len(domain)) + domain
+        
+        assert len(longest) == 254
+        assert email().validate(longest) is None
+        assert email().validate("a" + longest) == "Invalid email address"
+
+
+class TestIpAddress:
+    """Tests for the ip_address validator."""
+    
+    @pytest.mark.parametrize("value", [
+        "10.0.0.0/8",
+        "192.168.1.0/24",
+        "0.0.0.0/0",
+        "1.2.3.4/32",
+        "2001:db8::/32",
+        "::1/128",
+    ])
+    def test_valid_cidr(self, value):
+        """Test addresses with an in-range prefix are accepted."""
+        assert ip_address(allow_cidr=True).validate(value) is None
+    
+    @pytest.mark.parametrize("value", [
+        "1.2.3.4/³",  # superscript digit
+        "1.2.3.4/٢",  # Arabic-Indic digit
+        "1.2.3.4/２",  # fullwidth digit
+        "1.2.3.4/33",
+        "::1/129",
+        "1.2.3.4/",
+        "1.2.3.4/-1",
+        "1.2.3.4/ 8",
+    ])
+    def test_invalid_cidr(self, value):
+        """Test bad prefixes are rejected rather than raising."""
+        assert ip_address(allow_cidr=True).validate(value) == "Invalid IP address"
+    
+    def test_cidr_by_version(self):
+        """Test the prefix limit follows the requested IP version."""
+        assert ip_address(version=4, allow_cidr=True).validate("1.2.3.4/33") is not None
+        assert ip_address(version=6, allow_cidr=True).validate("::1/64") is None
+        assert ip_address(version=6, allow_cidr=True).validate("1.2.3.4/8") is not None
+    
+    def test_cidr_not_allowed(self):
+        """Test prefixes are rejected unless CIDR is allowed."""
+        assert ip_address().validate("10.0.0.0/8") == "Invalid IP address"
+        assert ip_address().validate("10.0.0.1") is None
+
+
+class _Fixed(Validator):
+    """Validator returning a fixed message and recording its calls."""
+    
+    def __init__(self, message: str | None, calls: list | None = None) -> None:
+        self.message = message
+        self.calls = calls if calls is not None else []
+    
+    def validate(self, value):
+        self.calls.append(value)
+        return self.message
+
+
+def _first_error(validators, value):
+    """Reference loop: first truthy message of the validators, or None."""
+    for validator in validators:
+        error_message = validator.validate(value)
+        if error_message:
+            return error_message
+    return None
+
+
+class TestCompileChain:
+    """Tests for compile_chain."""
+    
+    @pytest.mark.parametrize("length", [0, 1, 2, 3, 4, 6])
+    def test_matches_loop(self, length):
+        """Test chains of every unrolled length agree with the plain loop."""
+        patterns = [
+            [None] * length,
+            [""] * length,
+            [f"error {i}" for i in range(length)],
+            [None] * (length - 1) + ["last"] if length else [],
+            ["" if i % 2 else f"error {i}" for i in range(length)][::-1],
+        ]
+        for messages in patterns:
+            loop_calls: list = []
+            chain_calls: list = []
+            loop_validators = [_Fixed(m, loop_calls) for m in messages]
+            chain = compile_chain([_Fixed(m, chain_calls) for m in messages])
+            
+            assert (chain("v") or None) == _first_error(loop_validators, "v")
+            assert chain_calls == loop_calls
+    
+    def test_validators_snapshotted(self):
+        """Test later edits to the validator list are not picked up."""
+        validators = [_Fixed(None)]
+        chain = compile_chain(validators)
+        validators.append(_Fixed("bad"))
+        
+        assert not chain("v")
+
+
+class TestCompileSchema:
+    """Tests for compile_schema."""
+    
+    def test_matches_validate_dict(self):
+        """Test compiled schemas report the same errors as validate_dict."""
+        schema = {
+            "name": [required(), max_length(5)],
+            "age": [min_value(18)],
+            "missing": [required()],
+        }
+        check = compile_schema(schema)
+        for data in (
+            {"name": "alice", "age": 30, "missing": 1},
+            {"name": "alexander", "age": 3},
+            {},
+        ):
+            expected = validate_dict(data, schema)
+            actual = check(data)
+            assert actual.errors == expected.errors
+            assert actual.is_valid == expected.is_valid
+    
+    def test_stops_at_first_error(self):
+        """Test only the first failing validator of a field runs."""
+        calls: list = []
+        schema = {"a": [_Fixed(None, calls), _Fixed("first", calls), _Fixed("second", calls)]}
+        
+        result = compile_schema(schema)({"a": 1})
+        
+        assert [e.message for e in result.errors] == ["first"]
+        assert calls == [1, 1]
+        assert result.errors == validate_dict({"a": 1}, schema).errors
+    
+    def test_falsy_messages_pass(self):
+        """Test empty messages count as passing, like validate_dict."""
+        schema = {"a": [_Fixed(""), _Fixed("bad")], "b": [_Fixed("")]}
+        
+        result = compile_schema(schema)({"a": 1, "b": 2})
+        
+        assert result.errors == validate_dict({"a": 1, "b": 2}, schema).errors
+        assert [(e.field, e.message) for e in result.errors] == [("a", "bad")]
+    
+    def test_schema_is_snapshotted(self):
+        """Test later schema edits do not affect a compiled schema."""
+        schema = {"a": [required()]}
+        check = compile_schema(schema)
+        schema["b"] = [required()]
+        
+        assert check({"a": 1}).is_valid
+
+
+class TestValidateBatch:
+    """Tests for validate_batch."""
+    
+    def test_results_in_record_order(self):
+        """Test one result is returned per record, in order."""
+        schema = {"age": [min_value(18)]}
+        records = [{"age": 30}, {"age": 3}, {"age": 18}, {"age": 1}]
+        
+        results = validate_batch(records, schema)
+        
+        assert [r.is_valid for r in results] == [True, False, True, False]
+        assert [r.errors for r in results] == [validate_dict(r, schema).errors for r in records]
+    
+    def test_records_are_isolated(self):
+        """Test each record gets its own result object."""
+        results = validate_batch(iter([{}, {"a": 1}, {}]), {"a": [required()]})
+        
+        assert len({id(r) for r in results}) == 3
+        assert [len(r.errors) for r in results] == [1, 0, 1]
+        results[0].add_error("b", "extra")
+        assert results[2].get_errors("b") == []
+    
+    def test_empty_batch(self):
+        """Test no records give no results."""
+        assert validate_batch([], {"a": [required()]}) == []
+
+
+@validated_sync()
+def _scale(
+    a: Annotated[int, min_value(0)],
+    b: Annotated[int, min_value(0)] = 1,
+    *,
+    c: Annotated[int, min_value(0)] = 2,
+) -> tuple[int, int, int]:
+    return a, b, c
+
+
+class TestValidatedDecorator:
+    """Tests for the validated decorators."""
+    
+    def test_positional_and_keyword_calls(self):
+        """Test arguments are found however they are passed."""
+        assert _scale(1, 2, c=3) == (1, 2, 3)
+        assert _scale(a=1, b=2) == (1, 2, 2)
+        assert _scale(1) == (1, 1, 2)
+        
+        with pytest.raises(ValidationError):
+            _scale(1, -1)
+        with pytest.raises(ValidationError):
+            _scale(1, b=-1)
+        with pytest.raises(ValidationError):
+            _scale(1, c=-1)
+    
+    def test_defaults_are_validated(self):
+        """Test omitted arguments are validated with their defaults."""
+        @validated_sync()
+        def f(a: Annotated[int, min_value(0)] = -1) -> int:
+            return a
+        
+        assert f(5) == 5
+        with pytest.raises(ValidationError):
+            f()
+    
+    def test_bad_calls_raise_type_error(self):
+        """Test calls that do not bind raise TypeError before validation."""
+        with pytest.raises(TypeError, match="too many positional arguments"):
+            _scale(1, 2, 3)
+        with pytest.raises(TypeError, match="too many positional arguments"):
+            _scale(-1, -2, -3)
+        with pytest.raises(TypeError, match="missing a required argument"):
+            _scale(b=-1)
+        with pytest.raises(TypeError, match="unexpected keyword argument"):
+            _scale(1, d=-1)
+        with pytest.raises(TypeError, match="multiple values"):
+            _scale(-1, a=-1)
+    
+    def test_var_args_fallback(self):
+        """Test signatures with *args or **kwargs are still validated."""
+        @validated_sync()
+        def f(a: Annotated[int, min_value(0)], *args: int, **kwargs: int) -> int:
+            return a + sum(args) + sum(kwargs.values())
+        
+        assert f(1, 2, x=3) == 6
+        assert f(a=1, x=3) == 4
+        with pytest.raises(ValidationError):
+            f(-1, 2)
+        with pytest.raises(TypeError):
+            f(x=3)
+    
+    def test_errors_name_the_parameter(self):
+        """Test validation errors report the failing parameter."""
+        with pytest.raises(ValidationError) as exc_info:
+            _scale(1, 1, c=-1)
+        assert [e.field for e in exc_info.value.errors] == ["c"]
+    
+    async def test_async_variant(self):
+        """Test the async decorator validates before awaiting."""
+        @validated()
+        async def f(a: Annotated[int, min_value(0)], *, b: int = 0) -> int:
+            return a + b
+        
+        assert await f(1, b=2) == 3
+        with pytest.raises(ValidationError):
+            await f(-1)
+        with pytest.raises(TypeError, match="too many positional arguments"):
+            await f(1, 2)
+    
+    async def test_no_raise(self):
+        """Test raise_on_error=False still calls the function."""
+        @validated(raise_on_error=False)
+        async def f(a: Annotated[int, min_value(0)]) -> int:
+            return a
+        
+        assert await f(-1) == -1
@@ -13,10 +13,12 @@ from dev.engineeringlabs.pyboot.web.api import (
     Route,
     WebError,
     HTTPStatus,
+    Method,
 )
 
 from dev.engineeringlabs.pyboot.web.core import (
     Router,
+    RouteHost,
     CORSMiddleware,
     route,
     get,
@@ -32,8 +34,10 @@ __all__ = [
     "Route",
     "WebError",
     "HTTPStatus",
+    "Method",
     # Core
     "Router",
+    "RouteHost",
     "CORSMiddleware",
     "route",
     "get",
@@ -2,7 +2,7 @@
 
 from typing import Any
 from dataclasses import dataclass, field
-from enum import IntEnum
+from enum import IntEnum, IntFlag
 
 
 class HTTPStatus(IntEnum):
@@ -17,9 +17,30 @@ class HTTPStatus(IntEnum):
     INTERNAL_ERROR = 500
 
 
-@dataclass
-class Request:
-    """HTTP request."""
+class Method(IntFlag):
+    """HTTP methods as bit flags, so method sets test with ``&``."""
+    GET = 1
+    POST = 2
+    PUT = 4
+    DELETE = 8
+    OPTIONS = 16
+    HEAD = 32
+    PATCH = 64
+
+
+class _PathSegmentsSlot:
+    """Storage for Request's split path, kept out of the dataclass fields."""
+
+    __slots__ = ("_path_segments",)
+
+
+@dataclass(slots=True)
+class Request(_PathSegmentsSlot):
+    """HTTP request.
+
+    ``path_segments`` splits the path once and is shared by every stage
+    that needs it.
+    """
     method: str
     path: str
     headers: dict[str, str] = field(default_factory=dict)
@@ -27,8 +48,21 @@ class Request:
     body: bytes | None = None
     json_body: Any = None
 
+    @property
+    def path_segments(self) -> tuple[str, ...]:
+        """Path split on "/"; "/users/42" gives ("", "users", "42")."""
+        path = self.path
+        try:
+            cached_path, segments = self._path_segments
+        except AttributeError:
+            cached_path = None
+        if cached_path is not path:
+            segments = tuple(path.split("/"))
+            self._path_segments = (path, segments)
+        return segments
 
-@dataclass
+
+@dataclass(slots=True)
 class Response:
     """HTTP response."""
     status: HTTPStatus = HTTPStatus.OK
@@ -37,17 +71,21 @@ class Response:
     json_body: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     """Route definition."""
     method: str
     path: str
     handler: Any = None
+    is_sync: bool = False  # handler returns a Response rather than an awaitable
+    method_flag: int = 0  # Method flag for the method; 0 for other verbs
 
 
 class WebError(Exception):
     """Base error for web operations."""
     
+    __slots__ = ("message", "status", "cause")
+    
     def __init__(
         self,
         message: str,
@@ -63,6 +101,7 @@ class WebError(Exception):
 
 __all__ = [
     "HTTPStatus",
+    "Method",
     "Request",
     "Response",
     "Route",
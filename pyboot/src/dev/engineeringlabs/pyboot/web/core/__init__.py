@@ -1,58 +1,188 @@
 """Web Core - Web framework implementations."""
 
-from typing import Callable, Any, Awaitable
-from dataclasses import dataclass, field
-from dev.engineeringlabs.pyboot.web.api import Request, Response, Route, WebError, HTTPStatus
+import functools
+import inspect
+import sys
+from typing import Callable, Any, Awaitable, Iterable
+from dataclasses import dataclass
+from dev.engineeringlabs.pyboot.web.api import Request, Response, Route, WebError, HTTPStatus, Method
+
+# Canonical upper-case spelling of common HTTP methods, keyed by the upper-
+# and lower-case forms so the usual inputs skip str.upper()
+_METHODS = {
+    spelling: method
+    for method in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+    for spelling in (method, method.lower())
+}
+
+_METHOD_FLAGS = {method.name: method for method in Method}
+
+
+def _register_method(method: str) -> str:
+    """Canonicalize a method at registration; uncommon verbs are interned."""
+    return _METHODS.get(method) or sys.intern(method.upper())
+
+
+# Statuses used per request, resolved once instead of via enum attribute lookup
+_NOT_FOUND = HTTPStatus.NOT_FOUND
+_NO_CONTENT = HTTPStatus.NO_CONTENT
 
 
 class Router:
-    """HTTP router."""
+    """HTTP router.
+    
+    Paths are matched literally, so every route is indexed in a dict on
+    (method, path) and a lookup is a single probe regardless of how many
+    routes are registered.
+    """
     
     def __init__(self) -> None:
         self._routes: list[Route] = []
+        self._index: dict[tuple[str, str], Route] = {}
+    
+    def add_route(
+        self,
+        method: str,
+        path: str,
+        handler: Callable[..., Awaitable[Response] | Response],
+    ) -> None:
+        """Add a route.
+        
+        Handlers may be coroutine functions or plain functions returning a
+        Response; plain functions are dispatched without an await.
+        """
+        self._insert(method, path, handler)
+    
+    def add_routes(
+        self,
+        entries: Iterable[tuple[str, str, Callable[..., Awaitable[Response] | Response]]],
+    ) -> None:
+        """Add several (method, path, handler) routes at once."""
+        for method, path, handler in entries:
+            self._insert(method, path, handler)
     
-    def add_route(self, method: str, path: str, handler: Callable[..., Awaitable[Response]]) -> None:
-        """Add a route."""
-        self._routes.append(Route(method=method.upper(), path=path, handler=handler))
+    def mount(self, host: Any) -> None:
+        """Register every decorated handler on a class or instance.
+        
+        Handlers are looked up on ``host``, so mounting an instance
+        registers bound methods. RouteHost subclasses supply routes
+        collected at class definition; other objects are scanned.
+        """
+        cls = host if isinstance(host, type) else type(host)
+        entries = cls._routes if issubclass(cls, RouteHost) else _collect_routes(cls)
+        self.add_routes(
+            (method, path, getattr(host, name)) for name, method, path in entries
+        )
+    
+    def _insert(
+        self,
+        method: str,
+        path: str,
+        handler: Callable[..., Awaitable[Response] | Response],
+    ) -> None:
+        """Index a route."""
+        # Registered paths live as long as the router; interning lets
+        # equal-path compares short-circuit on identity
+        path = sys.intern(path)
+        method = _register_method(method)
+        route = Route(
+            method=method,
+            path=path,
+            handler=handler,
+            is_sync=not inspect.iscoroutinefunction(handler),
+            method_flag=_METHOD_FLAGS.get(method, 0),
+        )
+        self._routes.append(route)
+        # The first registration of a method/path pair wins
+        self._index.setdefault((method, path), route)
+    
+    def _register(
+        self,
+        method: str,
+        path: str,
+        handler: Callable[..., Awaitable[Response]],
+    ) -> Callable[..., Awaitable[Response]]:
+        """Add a route and return the handler unchanged (decorator body)."""
+        self.add_route(method, path, handler)
+        return handler
     
     def get(self, path: str) -> Callable[[Callable[..., Awaitable[Response]]], Callable[..., Awaitable[Response]]]:
         """Register a GET route."""
-        def decorator(handler: Callable[..., Awaitable[Response]]) -> Callable[..., Awaitable[Response]]:
-            self.add_route("GET", path, handler)
-            return handler
-        return decorator
+        return functools.partial(self._register, "GET", path)
     
     def post(self, path: str) -> Callable[[Callable[..., Awaitable[Response]]], Callable[..., Awaitable[Response]]]:
         """Register a POST route."""
-        def decorator(handler: Callable[..., Awaitable[Response]]) -> Callable[..., Awaitable[Response]]:
-            self.add_route("POST", path, handler)
-            return handler
-        return decorator
+        return functools.partial(self._register, "POST", path)
     
     def match(self, method: str, path: str) -> Route | None:
         """Find matching route."""
-        for route in self._routes:
-            if route.method == method.upper() and route.path == path:
-                return route
-        return None
+        return self._index.get((_METHODS.get(method) or method.upper(), path))
     
     async def handle(self, request: Request) -> Response:
         """Handle a request."""
         route = self.match(request.method, request.path)
         if not route:
-            return Response(status=HTTPStatus.NOT_FOUND)
+            return Response(status=_NOT_FOUND)
         if route.handler:
+            if route.is_sync:
+                result = route.handler(request)
+                # Callable objects with an async __call__ are not detected as
+                # coroutine functions at registration
+                if inspect.isawaitable(result):
+                    return await result
+                return result
             return await route.handler(request)
         return Response()
+    
+    def handle_sync(self, request: Request) -> Response:
+        """Handle a request without an event loop.
+        
+        Raises:
+            WebError: If the matched route's handler is asynchronous.
+        """
+        route = self.match(request.method, request.path)
+        if not route:
+            return Response(status=_NOT_FOUND)
+        if route.handler:
+            if not route.is_sync:
+                raise WebError(f"Handler for {route.method} {route.path} is async; use handle()")
+            result = route.handler(request)
+            if inspect.isawaitable(result):
+                close = getattr(result, "close", None)
+                if close is not None:
+                    close()  # avoid a "coroutine was never awaited" warning
+                raise WebError(f"Handler for {route.method} {route.path} is async; use handle()")
+            return result
+        return Response()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CORSConfig:
-    """CORS configuration."""
-    allow_origins: list[str] = field(default_factory=lambda: ["*"])
-    allow_methods: list[str] = field(default_factory=lambda: ["GET", "POST", "PUT", "DELETE"])
-    allow_headers: list[str] = field(default_factory=lambda: ["Content-Type"])
+    """CORS configuration.
+    
+    Immutable and hashable; list arguments are stored as tuples.
+    """
+    allow_origins: tuple[str, ...] = ("*",)
+    allow_methods: tuple[str, ...] = ("GET", "POST", "PUT", "DELETE")
+    allow_headers: tuple[str, ...] = ("Content-Type",)
     max_age: int = 86400
+    
+    def __post_init__(self) -> None:
+        for name in ("allow_origins", "allow_methods", "allow_headers"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+
+@functools.lru_cache(maxsize=32)
+def _preflight_headers_for(config: CORSConfig) -> dict[str, str]:
+    """Render preflight headers for a config (shared; copy before mutating)."""
+    return {
+        "Access-Control-Allow-Origin": ",".join(config.allow_origins),
+        "Access-Control-Allow-Methods": ",".join(config.allow_methods),
+        "Access-Control-Allow-Headers": ",".join(config.allow_headers),
+        "Access-Control-Max-Age": str(config.max_age),
+    }
 
 
 class CORSMiddleware:
@@ -60,34 +190,71 @@ class CORSMiddleware:
     
     def __init__(self, config: CORSConfig | None = None) -> None:
         self.config = config or CORSConfig()
+        # Header values are rendered once per distinct config
+        self._preflight_headers = _preflight_headers_for(self.config)
+        self._allow_origin = self._preflight_headers["Access-Control-Allow-Origin"]
     
     def process_request(self, request: Request) -> Response | None:
         """Process request (handle preflight)."""
         if request.method == "OPTIONS":
-            return Response(
-                status=HTTPStatus.NO_CONTENT,
-                headers={
-                    "Access-Control-Allow-Origin": ",".join(self.config.allow_origins),
-                    "Access-Control-Allow-Methods": ",".join(self.config.allow_methods),
-                    "Access-Control-Allow-Headers": ",".join(self.config.allow_headers),
-                    "Access-Control-Max-Age": str(self.config.max_age),
-                },
-            )
+            return Response(status=_NO_CONTENT, headers=self._preflight_headers.copy())
         return None
     
     def process_response(self, response: Response) -> Response:
         """Add CORS headers to response."""
-        response.headers["Access-Control-Allow-Origin"] = ",".join(self.config.allow_origins)
+        response.headers["Access-Control-Allow-Origin"] = self._allow_origin
         return response
 
 
 # Convenience decorators
+def _apply_route(
+    method: str,
+    path: str,
+    handler: Callable[..., Awaitable[Response]],
+) -> Callable[..., Awaitable[Response]]:
+    """Attach a (method, path) route spec to a handler.
+    
+    The Route itself is only built when a Router registers the handler.
+    """
+    handler._route_spec = (method, path)  # type: ignore
+    return handler
+
+
+def _collect_routes(cls: type) -> tuple[tuple[str, str, str], ...]:
+    """Find (attribute name, method, path) for decorated handlers on a class."""
+    routes = []
+    for name in dir(cls):
+        spec = getattr(getattr(cls, name, None), "_route_spec", None)
+        if spec is not None:
+            routes.append((name, *spec))
+    return tuple(routes)
+
+
+class RouteHost:
+    """Base class for handler containers.
+    
+    Decorated handlers are collected once when a subclass is defined, so
+    Router.mount() does not need to scan the class.
+    
+    Example:
+        class Users(RouteHost):
+            @get("/users")
+            async def list_users(self, request):
+                ...
+        
+        router.mount(Users())
+    """
+    
+    _routes: tuple[tuple[str, str, str], ...] = ()
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._routes = _collect_routes(cls)
+
+
 def route(method: str, path: str) -> Callable[[Callable[..., Awaitable[Response]]], Callable[..., Awaitable[Response]]]:
     """Route decorator."""
-    def decorator(handler: Callable[..., Awaitable[Response]]) -> Callable[..., Awaitable[Response]]:
-        handler._route = Route(method=method.upper(), path=path, handler=handler)  # type: ignore
-        return handler
-    return decorator
+    return functools.partial(_apply_route, _register_method(method), path)
 
 
 def get(path: str) -> Callable[[Callable[..., Awaitable[Response]]], Callable[..., Awaitable[Response]]]:
@@ -112,6 +279,7 @@ def delete(path: str) -> Callable[[Callable[..., Awaitable[Response]]], Callable
 
 __all__ = [
     "Router",
+    "RouteHost",
     "CORSMiddleware",
     "route",
     "get",
@@ -1,12 +1,16 @@
 """Tests for web module."""
 
+import dataclasses
+
 import pytest
 from dev.engineeringlabs.pyboot.web import (
     Router,
+    RouteHost,
     Request,
     Response,
     Route,
     HTTPStatus,
+    Method,
     WebError,
     get,
     post,
@@ -51,6 +55,49 @@ class TestRequest:
             json_body={"name": "test"},
         )
         assert request.json_body["name"] == "test"
+    
+    def test_request_path_segments(self):
+        """Test path segments are cached and reset with the path."""
+        request = Request(method="GET", path="/api/users")
+        assert request.path_segments == ("", "api", "users")
+        assert request.path_segments is request.path_segments
+        
+        request.path = "/api"
+        assert request.path_segments == ("", "api")
+    
+    def test_request_default_dicts(self):
+        """Test each request gets its own headers and query dicts."""
+        first = Request(method="GET", path="/")
+        second = Request(method="GET", path="/")
+        first.headers["A"] = "1"
+        first.query["q"] = "x"
+        
+        assert second.headers == {}
+        assert second.query == {}
+    
+    def test_request_equality_and_repr(self):
+        """Test requests compare by field and print every field."""
+        request = Request(method="GET", path="/")
+        assert request == Request(method="GET", path="/", headers={}, query={})
+        assert request != Request(method="GET", path="/", headers={"A": "1"})
+        assert repr(Request(method="GET", path="/")) == (
+            "Request(method='GET', path='/', headers={}, query={}, "
+            "body=None, json_body=None)"
+        )
+    
+    def test_request_dataclass_helpers(self):
+        """Test replace, asdict and fields see the public field names."""
+        request = Request(method="GET", path="/a", headers={"A": "1"})
+        
+        assert [f.name for f in dataclasses.fields(Request)] == [
+            "method", "path", "headers", "query", "body", "json_body",
+        ]
+        assert dataclasses.asdict(request)["headers"] == {"A": "1"}
+        
+        copy = dataclasses.replace(request, path="/b")
+        assert copy.headers == {"A": "1"}
+        assert copy.path_segments == ("", "b")
+        assert request.path_segments == ("", "a")
 
 
 class TestResponse:
@@ -71,6 +118,24 @@ class TestResponse:
         """Test response with JSON body."""
         response = Response(json_body={"data": "value"})
         assert response.json_body["data"] == "value"
+    
+    def test_response_headers(self):
+        """Test default headers are empty and compare by value."""
+        response = Response()
+        assert response == Response(headers={})
+        response.headers["X"] = "1"
+        assert response.headers == {"X": "1"}
+        assert response != Response()
+        assert repr(Response(status=HTTPStatus.CREATED)) == (
+            "Response(status=<HTTPStatus.CREATED: 201>, headers={}, "
+            "body=None, json_body=None)"
+        )
+    
+    def test_response_dataclass_helpers(self):
+        """Test replace and asdict keep the headers."""
+        response = Response(headers={"X": "1"})
+        assert dataclasses.replace(response, status=HTTPStatus.CREATED).headers == {"X": "1"}
+        assert dataclasses.asdict(Response())["headers"] == {}
 
 
 class TestHTTPStatus:
@@ -85,6 +150,24 @@ class TestHTTPStatus:
         assert HTTPStatus.INTERNAL_ERROR == 500
 
 
+class TestMethod:
+    """Tests for Method flags."""
+    
+    def test_route_method_flag(self):
+        """Test registered routes carry their method flag."""
+        router = Router()
+        
+        async def handler(req):
+            return Response()
+        
+        router.add_route("post", "/items", handler)
+        router.add_route("PROPFIND", "/dav", handler)
+        
+        assert router.match("POST", "/items").method_flag & (Method.GET | Method.POST)
+        assert not router.match("POST", "/items").method_flag & Method.GET
+        assert router.match("PROPFIND", "/dav").method_flag == 0
+
+
 class TestRouter:
     """Tests for Router."""
     
@@ -141,6 +224,32 @@ class TestRouter:
         
         assert response.status == HTTPStatus.NOT_FOUND
     
+    @pytest.mark.asyncio
+    async def test_sync_handler(self):
+        """Test plain-function handlers are dispatched without await."""
+        router = Router()
+        
+        def handler(req):
+            return Response(json_body={"sync": True})
+        
+        router.add_route("GET", "/sync", handler)
+        request = Request(method="GET", path="/sync")
+        
+        assert (await router.handle(request)).json_body["sync"] is True
+        assert router.handle_sync(request).json_body["sync"] is True
+    
+    def test_handle_sync_rejects_async_handler(self):
+        """Test handle_sync refuses coroutine handlers."""
+        router = Router()
+        
+        @router.get("/async")
+        async def handler(req):
+            return Response()
+        
+        with pytest.raises(WebError):
+            router.handle_sync(Request(method="GET", path="/async"))
+        assert router.handle_sync(Request(method="GET", path="/missing")).status == HTTPStatus.NOT_FOUND
+    
     def test_match_route(self):
         """Test matching a route."""
         router = Router()
@@ -159,6 +268,101 @@ class TestRouter:
         router = Router()
         route = router.match("GET", "/unknown")
         assert route is None
+    
+    def test_match_nested_paths(self):
+        """Test matching among routes sharing a prefix."""
+        router = Router()
+        
+        async def handler(req):
+            return Response()
+        
+        for path in ["/api/users", "/api/users/admins", "/api/items"]:
+            router.add_route("GET", path, handler)
+        router.add_route("POST", "/api/users", handler)
+        
+        assert router.match("GET", "/api/users/admins").path == "/api/users/admins"
+        assert router.match("post", "/api/users").method == "POST"
+        assert router.match("GET", "/api") is None
+        assert router.match("GET", "/api/users/") is None
+        assert router.match("DELETE", "/api/users") is None
+    
+    def test_match_pattern_path(self):
+        """Test paths with pattern characters are matched literally."""
+        router = Router()
+        
+        async def handler(req):
+            return Response()
+        
+        router.add_route("GET", "/users/{id}", handler)
+        router.add_route("GET", "/users", handler)
+        
+        assert router.match("GET", "/users/{id}").path == "/users/{id}"
+        assert router.match("GET", "/users").path == "/users"
+        assert router.match("GET", "/users/42") is None
+        
+        # Later registrations are seen by lookups made before them
+        assert router.match("POST", "/users/{id}") is None
+        router.add_route("POST", "/users/{id}", handler)
+        assert router.match("POST", "/users/{id}").method == "POST"
+    
+    @pytest.mark.asyncio
+    async def test_match_shared_prefix_patterns(self):
+        """Test pattern routes under long shared prefixes."""
+        router = Router()
+        
+        async def handler(req):
+            return Response()
+        
+        router.add_routes([
+            ("GET", "/api/v1/users/{id}", handler),
+            ("GET", "/api/v1/users/{id}/posts/{post}", handler),
+            ("GET", "/api/v1/items/{id}", handler),
+        ])
+        
+        assert router.match("GET", "/api/v1/users/{id}/posts/{post}") is not None
+        assert router.match("GET", "/api/v1/users/{id}").path == "/api/v1/users/{id}"
+        assert router.match("GET", "/api/v1/items/{id}") is not None
+        assert router.match("GET", "/api/v1/users/{id}/posts") is None
+        assert router.match("GET", "/api/v1/items") is None
+        assert router.match("GET", "/api/v2/items/{id}") is None
+        assert (await router.handle(Request(method="GET", path="/api/v1/items/{id}"))).status == HTTPStatus.OK
+        
+        # Registering after a lookup is seen by later lookups
+        router.add_route("GET", "/api/v1/users/{id}/posts", handler)
+        assert router.match("GET", "/api/v1/users/{id}/posts") is not None
+        assert router.match("GET", "/api/v1/users/{id}/posts/{post}") is not None
+    
+    def test_add_routes(self):
+        """Test registering several routes at once."""
+        router = Router()
+        
+        async def handler(req):
+            return Response()
+        
+        router.add_routes([
+            ("GET", "/a", handler),
+            ("post", "/b", handler),
+            ("GET", "/c/{id}", handler),
+        ])
+        
+        assert router.match("GET", "/a") is not None
+        assert router.match("POST", "/b") is not None
+        assert router.match("GET", "/c/{id}") is not None
+    
+    def test_first_registration_wins(self):
+        """Test duplicate routes resolve to the first registered."""
+        router = Router()
+        
+        async def first(req):
+            return Response()
+        
+        async def second(req):
+            return Response()
+        
+        router.add_route("GET", "/dup", first)
+        router.add_route("GET", "/dup", second)
+        
+        assert router.match("GET", "/dup").handler is first
 
 
 class TestRouteDecorators:
@@ -170,8 +374,7 @@ class TestRouteDecorators:
         async def handler(request):
             return Response()
         
-        assert handler._route.method == "GET"
-        assert handler._route.path == "/api/items"
+        assert handler._route_spec == ("GET", "/api/items")
     
     def test_post_decorator(self):
         """Test @post decorator."""
@@ -179,7 +382,7 @@ class TestRouteDecorators:
         async def handler(request):
             return Response()
         
-        assert handler._route.method == "POST"
+        assert handler._route_spec[0] == "POST"
     
     def test_put_decorator(self):
         """Test @put decorator."""
@@ -187,7 +390,7 @@ class TestRouteDecorators:
         async def handler(request):
             return Response()
         
-        assert handler._route.method == "PUT"
+        assert handler._route_spec[0] == "PUT"
     
     def test_delete_decorator(self):
         """Test @delete decorator."""
@@ -195,7 +398,48 @@ class TestRouteDecorators:
         async def handler(request):
             return Response()
         
-        assert handler._route.method == "DELETE"
+        assert handler._route_spec[0] == "DELETE"
+
+
+class TestRouteHost:
+    """Tests for RouteHost and Router.mount."""
+    
+    @pytest.mark.asyncio
+    async def test_mount_instance(self):
+        """Test mounting an instance registers bound handlers."""
+        class Users(RouteHost):
+            def __init__(self):
+                self.names = ["alice"]
+            
+            @get("/users")
+            async def list_users(self, request):
+                return Response(json_body={"users": self.names})
+            
+            @post("/users")
+            def create_user(self, request):
+                return Response(status=HTTPStatus.CREATED)
+        
+        assert {method for _, method, _ in Users._routes} == {"GET", "POST"}
+        
+        router = Router()
+        router.mount(Users())
+        
+        response = await router.handle(Request(method="GET", path="/users"))
+        assert response.json_body["users"] == ["alice"]
+        assert router.handle_sync(Request(method="POST", path="/users")).status == HTTPStatus.CREATED
+    
+    def test_mount_plain_class(self):
+        """Test mounting a class that is not a RouteHost."""
+        class Health:
+            @staticmethod
+            @get("/health")
+            def health(request):
+                return Response()
+        
+        router = Router()
+        router.mount(Health)
+        
+        assert router.match("GET", "/health") is not None
 
 
 class TestCORSMiddleware:
@@ -242,6 +486,23 @@ class TestCORSMiddleware:
         response = cors.process_request(request)
         
         assert "https://example.com" in response.headers["Access-Control-Allow-Origin"]
+    
+    def test_cors_config_is_hashable(self):
+        """Test CORSConfig normalizes lists and is hashable."""
+        a = CORSConfig(allow_origins=["https://example.com"])
+        b = CORSConfig(allow_origins=("https://example.com",))
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a.allow_origins == ("https://example.com",)
+    
+    def test_preflight_headers_not_shared(self):
+        """Test mutating one preflight response does not affect the next."""
+        cors = CORSMiddleware()
+        request = Request(method="OPTIONS", path="/api")
+        
+        cors.process_request(request).headers["X-Extra"] = "1"
+        
+        assert "X-Extra" not in cors.process_request(request).headers
 
 
 class TestWebError: